@@ -0,0 +1,240 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, List
+from models import Process
+from timeline import iter_slices
+
+class Allocator(ABC):
+    """Asignador dinámico de memoria contigua (direcciones 0..total-1)."""
+
+    total: int
+    free_bytes: int
+
+    @abstractmethod
+    def allocate(self, size: int) -> int:
+        """Retorna la dirección asignada, o -1 si no hay un hueco suficiente."""
+        pass
+
+    @abstractmethod
+    def free(self, address: int):
+        pass
+
+    @abstractmethod
+    def largest_free(self) -> int:
+        pass
+
+    def external_fragmentation(self) -> float:
+        # 1 - (hueco más grande / memoria libre): 0 = todo el espacio libre es contiguo
+        return 1 - self.largest_free() / self.free_bytes if self.free_bytes else 0.0
+
+class FreeListAllocator(Allocator):
+    """
+    Lista de huecos ordenada por dirección con coalescencia al liberar.
+    Junto a ella se mantiene un índice ordenado por tamaño (tamaño, dirección)
+    para elegir el hueco por mejor ajuste con bisect; liberar ubica a los
+    vecinos por dirección y fusiona los adyacentes. O(log huecos) por operación
+    (más el memmove de las inserciones en las listas).
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.free_bytes = total
+        self.starts: List[int] = [0] if total else [] # Huecos por dirección
+        self.lengths: Dict[int, int] = {0: total} if total else {}
+        self.by_size: List = [(total, 0)] if total else []
+        self.allocated: Dict[int, int] = {} # dirección -> tamaño
+
+    def _remove_hole(self, start: int):
+        length = self.lengths.pop(start)
+        del self.starts[bisect_left(self.starts, start)]
+        del self.by_size[bisect_left(self.by_size, (length, start))]
+
+    def _add_hole(self, start: int, length: int):
+        self.lengths[start] = length
+        insort(self.starts, start)
+        insort(self.by_size, (length, start))
+
+    def allocate(self, size: int) -> int:
+        k = bisect_left(self.by_size, (size, -1))
+        if k == len(self.by_size):
+            return -1
+        length, start = self.by_size[k]
+        self._remove_hole(start)
+        if length > size:
+            self._add_hole(start + size, length - size)
+        self.allocated[start] = size
+        self.free_bytes -= size
+        return start
+
+    def free(self, address: int):
+        size = self.allocated.pop(address)
+        self.free_bytes += size
+        start, end = address, address + size
+
+        # Fusionar con el hueco siguiente y con el anterior si son adyacentes
+        k = bisect_left(self.starts, start)
+        if k < len(self.starts) and self.starts[k] == end:
+            end += self.lengths[end]
+            self._remove_hole(self.starts[k])
+        if k > 0:
+            prev = self.starts[k - 1]
+            if prev + self.lengths[prev] == start:
+                start = prev
+                self._remove_hole(prev)
+        self._add_hole(start, end - start)
+
+    def largest_free(self) -> int:
+        return self.by_size[-1][0] if self.by_size else 0
+
+class BuddyAllocator(Allocator):
+    """
+    Buddy system: la memoria se divide en bloques de orden k (tamaño
+    min_block * 2**k). Si total / min_block no es potencia de 2, la memoria
+    se reparte en bloques raíz de órdenes decrecientes (uno por bit, p. ej.
+    1000 = 512 + 256 + 128 + 64 + 32 + 8) que nunca se fusionan entre sí, así
+    `total` es el tamaño pedido (redondeado hacia abajo a múltiplo de
+    min_block). Una lista libre (set) por orden y un bitmap de órdenes no
+    vacíos eligen el bloque a partir en O(1); al liberar se fusiona con su
+    buddy (dirección XOR tamaño) mientras esté libre.
+    O(log total) por operación. Registra la fragmentación interna.
+    """
+
+    def __init__(self, total: int, min_block: int = 1):
+        self.min_block = min_block
+        units = max(total, 0) // min_block
+        self.max_order = max(units.bit_length() - 1, 0)
+        self.total = units * min_block
+        self.free_bytes = self.total
+        self.free_lists = [set() for _ in range(self.max_order + 1)]
+        self.mask = 0
+        # Bloques raíz de mayor a menor orden: cada dirección queda alineada a
+        # su tamaño y el buddy de una raíz cae fuera de la memoria o en una
+        # raíz menor, así que las raíces no se fusionan
+        address = 0
+        for order in range(self.max_order, -1, -1):
+            if units >> order & 1:
+                self._push(order, address)
+                address += min_block << order
+        self.allocated: Dict[int, int] = {} # dirección -> orden
+        self.requested: Dict[int, int] = {} # dirección -> tamaño pedido
+        self.internal_waste = 0
+
+    def _order_for(self, size: int) -> int:
+        blocks = -(-size // self.min_block)
+        return (blocks - 1).bit_length()
+
+    def _push(self, order: int, address: int):
+        self.free_lists[order].add(address)
+        self.mask |= 1 << order
+
+    def _discard(self, order: int, address: int) -> bool:
+        free_list = self.free_lists[order]
+        if address not in free_list:
+            return False
+        free_list.remove(address)
+        if not free_list:
+            self.mask &= ~(1 << order)
+        return True
+
+    def allocate(self, size: int) -> int:
+        order = self._order_for(size)
+        available = self.mask >> order << order # Órdenes >= order con bloques libres
+        if order > self.max_order or not available:
+            return -1
+        k = (available & -available).bit_length() - 1
+        address = next(iter(self.free_lists[k]))
+        self._discard(k, address)
+        # Partir hasta el orden pedido, dejando libre la mitad superior
+        while k > order:
+            k -= 1
+            self._push(k, address + (self.min_block << k))
+        self.allocated[address] = order
+        self.requested[address] = size
+        block = self.min_block << order
+        self.free_bytes -= block
+        self.internal_waste += block - size
+        return address
+
+    def free(self, address: int):
+        order = self.allocated.pop(address)
+        block = self.min_block << order
+        self.free_bytes += block
+        self.internal_waste -= block - self.requested.pop(address)
+        while order < self.max_order:
+            buddy = address ^ (self.min_block << order)
+            if not self._discard(order, buddy):
+                break
+            address = min(address, buddy)
+            order += 1
+        self._push(order, address)
+
+    def largest_free(self) -> int:
+        return self.min_block << (self.mask.bit_length() - 1) if self.mask else 0
+
+@dataclass
+class DynamicMemoryResult:
+    allocations: int = 0
+    failures: int = 0
+    frees: int = 0
+    events: int = 0
+    peak_used: int = 0
+    total: int = 0 # Memoria efectiva del asignador
+    # Muestras cada `sample_every` eventos: tiempo, memoria usada, libre,
+    # hueco más grande y fragmentación externa
+    samples: List[Dict] = field(default_factory=list)
+
+def simulate_dynamic_partitions(processes: List[Process], timeline, allocator: Allocator,
+                                sample_every: int = None) -> DynamicMemoryResult:
+    """
+    Asignación dinámica dirigida por el planificador de CPU: cada proceso pide
+    `size` al llegar y libera su partición cuando termina según el timeline
+    (fin de su último tramo). Los eventos se ordenan por tiempo y, a igual
+    tiempo, las liberaciones van primero. Si no hay un hueco suficiente la
+    asignación falla y el proceso no ocupa memoria.
+    Por defecto se toman ~500 muestras de fragmentación a lo largo de la corrida.
+    """
+    finish: Dict[int, int] = {}
+    for pid, _, end, _ in iter_slices(timeline):
+        if end > finish.get(pid, -1):
+            finish[pid] = end
+
+    # (tiempo, tipo, índice): tipo 0 = liberar, 1 = asignar
+    events = [(p.arrival_time, 1, i) for i, p in enumerate(processes)]
+    events.extend((finish[p.pid], 0, i) for i, p in enumerate(processes) if p.pid in finish)
+    events.sort()
+    if sample_every is None:
+        sample_every = max(1, len(events) // 500)
+
+    result = DynamicMemoryResult(total=allocator.total)
+    address = [-1] * len(processes)
+
+    for time, kind, i in events:
+        if kind == 1:
+            # Un proceso sin tamaño no ocupa memoria (dirección -1, nada que liberar)
+            size = processes[i].size
+            addr = allocator.allocate(size) if size > 0 else -1
+            if addr == -1 and size > 0:
+                result.failures += 1
+            else:
+                address[i] = addr
+                result.allocations += 1
+        elif address[i] != -1:
+            allocator.free(address[i])
+            address[i] = -1
+            result.frees += 1
+
+        result.events += 1
+        used = allocator.total - allocator.free_bytes
+        if used > result.peak_used:
+            result.peak_used = used
+        if result.events % sample_every == 0:
+            result.samples.append({
+                'time': time,
+                'used': used,
+                'free': allocator.free_bytes,
+                'largest_free': allocator.largest_free(),
+                'external_fragmentation': allocator.external_fragmentation(),
+            })
+
+    return result
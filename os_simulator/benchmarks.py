@@ -0,0 +1,54 @@
+import random
+import time
+from typing import List, Dict
+from models import Process
+from cpu_scheduler import RoundRobinStrategy
+
+def generate_processes(num_processes: int, seed: int = 135) -> List[Process]:
+    # Carga sintética en memoria con los mismos rangos que data_generator,
+    # sin pasar por el JSON (que a millones de procesos domina el tiempo)
+    rnd = random.Random(seed)
+    max_arrival = num_processes * 5
+    return [
+        Process(i + 1, rnd.randint(0, max_arrival), rnd.randint(1, 20), rnd.randint(1, 10), [], [])
+        for i in range(num_processes)
+    ]
+
+def benchmark_round_robin(sizes: List[int], quanta: List[int], seed: int = 135) -> List[Dict]:
+    """
+    Mide RoundRobinStrategy para cada combinación (procesos, quantum).
+    Retorna una fila por corrida con el tiempo total y el tiempo por rebanada:
+    este último debe mantenerse ~constante si el costo es O(rebanadas),
+    es decir, lineal en procesos e inverso al quantum.
+    """
+    rows = []
+    strategy = RoundRobinStrategy()
+    for n in sizes:
+        processes = generate_processes(n, seed)
+        for q in quanta:
+            t0 = time.perf_counter()
+            timeline, _, _ = strategy.schedule(processes, q)
+            elapsed = time.perf_counter() - t0
+            rows.append({
+                'processes': n,
+                'quantum': q,
+                'slices': len(timeline),
+                'seconds': elapsed,
+                'us_per_slice': elapsed / len(timeline) * 1e6,
+            })
+    return rows
+
+def print_rows(rows: List[Dict]):
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    print("  ".join(f"{h:>12}" for h in headers))
+    for row in rows:
+        print("  ".join(f"{row[h]:>12.4f}" if isinstance(row[h], float) else f"{row[h]:>12}" for h in headers))
+
+if __name__ == "__main__":
+    print("Round Robin: escalamiento en procesos (quantum=1)")
+    print_rows(benchmark_round_robin([10_000, 100_000, 1_000_000], [1]))
+    print()
+    print("Round Robin: escalamiento en quantum (100k procesos)")
+    print_rows(benchmark_round_robin([100_000], [1, 2, 4, 8, 16]))
@@ -1,298 +1,484 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple
 from models import Process
-import copy
+from collections import deque
+from array import array
+import heapq
+from structures import IndexedHeap
+from timeline import RecordTimeline, ColumnarTimeline
 
 class CPUSchedulingStrategy(ABC):
+    # Si es True, el timeline se emite en columnas (ColumnarTimeline)
+    columnar = False
+
     @abstractmethod
     def schedule(self, processes: List[Process], quantum: int = None) -> Tuple[List[Dict], float, float]:
         """
         Retorna:
         1. Timeline (Gantt): Lista de dicts {'pid': int, 'start': int, 'end': int}
+           o un ColumnarTimeline si `columnar` está activo
         2. Average Wait Time
         3. Average Turnaround Time
         """
         pass
 
-class FCFSStrategy(CPUSchedulingStrategy):
+    def new_timeline(self, with_core: bool = False):
+        return ColumnarTimeline(with_core) if self.columnar else RecordTimeline()
+
+class NonPreemptiveStrategy(CPUSchedulingStrategy):
+    """
+    Núcleo común de las políticas no expropiativas (FCFS, SJF, Prioridad).
+    Recorre la lista de llegadas ordenada una sola vez, mantiene los procesos
+    listos en un heap y, si la CPU queda ociosa, salta el reloj directamente
+    a la siguiente llegada en lugar de avanzar tick a tick.
+    Costo: O(n log n).
+    """
+
+    @abstractmethod
+    def ready_key(self, process: Process):
+        """Clave de orden dentro de la cola de listos (menor = se atiende antes)."""
+        pass
+
     def schedule(self, processes: List[Process], quantum: int = None):
-        # Implementación basada en el código proporcionado por el usuario
-        # t_0 -> arrival_time
-        # t -> burst_time
-        
-        # Ordenar por llegada (t_0)
-        # Nota: El código original del usuario asume que ya vienen o se procesan en orden de llegada si hay empate
-        # Aquí aseguramos el ordenamiento inicial
+        # El orden estable por llegada define el desempate: a igual clave,
+        # se atiende el proceso que aparece antes en la lista ordenada
         sorted_procs = sorted(processes, key=lambda p: p.arrival_time)
-        
-        t_0 = [p.arrival_time for p in sorted_procs]
-        t = [p.burst_time for p in sorted_procs]
-        pids = [p.pid for p in sorted_procs]
-        
-        reloj = 0
-        candidato = 0
-        pocicion = 0
-        r = [] # Lista de índices procesados
-        
-        timeline = []
-        t_i = {} # Tiempo inicio real
-        t_f = {} # Tiempo final
-        
-        # Lógica adaptada del usuario:
-        # while len(r)< len(t_0):
-        #     t_aux=reloj
-        #     while pocicion <len(t_0):
-        #         if pocicion not in r and t_0[pocicion]<=reloj:
-        #             minimo= t_0[pocicion]
-        #             candidato = pocicion
-        #             for i in range(pocicion,len(t_0)):
-        #                 if t_0[i]<= reloj and t_0[i]< minimo and i not in r:
-        #                     minimo= t_0[i]
-        #                     candidato = i
-        #             ...
-        
-        # Simplificación: Como ya ordenamos por arrival_time, FCFS es simplemente iterar en orden
-        # Pero mantendremos la lógica de "reloj" para ser fieles al comportamiento de simulación
-        
-        processed_count = 0
         n = len(sorted_procs)
-        
-        while processed_count < n:
-            # Buscar candidato disponible (llegó antes o igual al reloj)
-            # En FCFS puro ordenado, siempre es el siguiente en la lista que cumpla la condición
-            
-            # Filtrar candidatos que ya llegaron y no han sido procesados
-            candidates_idx = [i for i in range(n) if i not in r and t_0[i] <= reloj]
-            
-            if not candidates_idx:
-                # Si no hay nadie, avanzar reloj
-                reloj += 1
-                continue
-            
-            # De los candidatos, el que tenga menor tiempo de llegada (FCFS)
-            # Como ya ordenamos sorted_procs por arrival_time, el primero de la lista candidates_idx es el correcto
-            # Sin embargo, para ser robustos con el código original que busca el mínimo:
-            best_idx = candidates_idx[0]
-            min_arrival = t_0[best_idx]
-            
-            for idx in candidates_idx:
-                if t_0[idx] < min_arrival:
-                    min_arrival = t_0[idx]
-                    best_idx = idx
-            
-            # Procesar
+
+        reloj = 0
+        siguiente = 0 # Próxima llegada por encolar
+        listos = [] # Heap de (clave, índice)
+        timeline = self.new_timeline()
+
+        total_wait = 0
+        total_turnaround = 0
+
+        while siguiente < n or listos:
+            # CPU ociosa: saltar a la siguiente llegada
+            if not listos and sorted_procs[siguiente].arrival_time > reloj:
+                reloj = sorted_procs[siguiente].arrival_time
+
+            while siguiente < n and sorted_procs[siguiente].arrival_time <= reloj:
+                heapq.heappush(listos, (self.ready_key(sorted_procs[siguiente]), siguiente))
+                siguiente += 1
+
+            _, idx = heapq.heappop(listos)
+            proc = sorted_procs[idx]
+
             start_time = reloj
-            burst = t[best_idx]
-            end_time = start_time + burst
-            
-            timeline.append({'pid': pids[best_idx], 'start': start_time, 'end': end_time})
-            
-            t_f[pids[best_idx]] = end_time
+            end_time = start_time + proc.burst_time
+            timeline.add(proc.pid, start_time, end_time)
             reloj = end_time
-            r.append(best_idx)
-            processed_count += 1
-            
-        # Calcular métricas finales
+
+            turnaround = end_time - proc.arrival_time
+            total_turnaround += turnaround
+            total_wait += turnaround - proc.burst_time
+
+        avg_wait = total_wait / n
+        avg_turnaround = total_turnaround / n
+
+        return timeline, avg_wait, avg_turnaround
+
+class FCFSStrategy(NonPreemptiveStrategy):
+    def ready_key(self, process: Process):
+        # Orden de llegada (t_0)
+        return process.arrival_time
+
+class SJFStrategy(NonPreemptiveStrategy):
+    # SJN (Shortest Job Next) es equivalente a SJF
+    def ready_key(self, process: Process):
+        return process.burst_time
+
+class RoundRobinStrategy(CPUSchedulingStrategy):
+    def schedule(self, processes: List[Process], quantum: int = 2):
+        # Round Robin con Quantum
+        # Cola de listos como deque de índices y ráfaga restante en un arreglo
+        # tipado: cada rebanada cuesta O(1), una pasada completa O(rebanadas)
+        pending = sorted(processes, key=lambda p: p.arrival_time)
+        n = len(pending)
+        remaining = array('q', (p.burst_time for p in pending))
+
+        ready_queue = deque()
+        siguiente = 0 # Próxima llegada por encolar
+        current_time = 0
+        timeline = self.new_timeline()
+
         total_wait = 0
         total_turnaround = 0
-        
-        for p in sorted_procs:
-            end_t = t_f[p.pid]
-            turnaround = end_t - p.arrival_time
-            wait = turnaround - p.burst_time
-            total_wait += wait
-            total_turnaround += turnaround
-            
+
+        while ready_queue or siguiente < n:
+            if not ready_queue:
+                # CPU ociosa: saltar directo a la siguiente llegada
+                if pending[siguiente].arrival_time > current_time:
+                    current_time = pending[siguiente].arrival_time
+                while siguiente < n and pending[siguiente].arrival_time <= current_time:
+                    ready_queue.append(siguiente)
+                    siguiente += 1
+
+            idx = ready_queue.popleft()
+            burst_to_do = min(remaining[idx], quantum)
+
+            start_time = current_time
+            end_time = start_time + burst_to_do
+            timeline.add(pending[idx].pid, start_time, end_time)
+
+            remaining[idx] -= burst_to_do
+            current_time = end_time
+
+            # Verificar si llegaron nuevos procesos MIENTRAS se ejecutaba este
+            while siguiente < n and pending[siguiente].arrival_time <= current_time:
+                ready_queue.append(siguiente)
+                siguiente += 1
+
+            if remaining[idx] > 0:
+                ready_queue.append(idx) # Vuelve a la cola
+            else:
+                # Terminó
+                turnaround = current_time - pending[idx].arrival_time
+                total_turnaround += turnaround
+                total_wait += turnaround - pending[idx].burst_time
+
         avg_wait = total_wait / n
         avg_turnaround = total_turnaround / n
-        
+
         return timeline, avg_wait, avg_turnaround
 
-class SJFStrategy(CPUSchedulingStrategy):
+class PriorityStrategy(NonPreemptiveStrategy):
+    # Menor valor numérico = mayor prioridad
+    def ready_key(self, process: Process):
+        return process.priority
+
+class PreemptiveStrategy(CPUSchedulingStrategy):
+    """
+    Núcleo común de las políticas expropiativas (SRTF, Prioridad Expropiativa).
+    Dirigido por eventos: sólo reacciona en llegadas y finalizaciones.
+    El proceso en ejecución permanece dentro de un heap indexado junto a los
+    listos; en cada evento se actualiza su clave (decrease-key) y el tope del
+    heap indica quién debe tener la CPU. Costo: O((n + expropiaciones) log n).
+    """
+
+    @abstractmethod
+    def ready_key(self, process: Process, remaining: int, now: int):
+        """Clave de un proceso en espera (menor = mejor candidato)."""
+        pass
+
+    @abstractmethod
+    def running_key(self, process: Process, remaining: int, now: int):
+        """Clave del proceso en ejecución al momento `now`."""
+        pass
+
     def schedule(self, processes: List[Process], quantum: int = None):
-        # Implementación basada en el código SJN() del usuario
-        # SJN (Shortest Job Next) es equivalente a SJF
-        
         sorted_procs = sorted(processes, key=lambda p: p.arrival_time)
-        t_0 = [p.arrival_time for p in sorted_procs]
-        t = [p.burst_time for p in sorted_procs]
-        pids = [p.pid for p in sorted_procs]
-        
-        reloj = 0
-        r = [] # Índices procesados
-        timeline = []
-        t_f = {}
-        
         n = len(sorted_procs)
-        
-        while len(r) < n:
-            candidatos = []
-            for i in range(n):
-                if i not in r:
-                    if t_0[i] <= reloj:
-                        candidatos.append(i)
-            
-            if candidatos:
-                # candidato = min(candidatos,key=lambda x:t[x])
-                candidato_idx = min(candidatos, key=lambda x: t[x])
-                
-                start_time = reloj
-                burst = t[candidato_idx]
-                end_time = start_time + burst
-                
-                timeline.append({'pid': pids[candidato_idx], 'start': start_time, 'end': end_time})
-                
-                t_f[pids[candidato_idx]] = end_time
-                reloj = end_time
-                r.append(candidato_idx)
-            else:
-                reloj += 1
-                
-        # Métricas
+        remaining = array('q', (p.burst_time for p in sorted_procs))
+
+        # La clave se acompaña de un desempate: el índice de llegada para los
+        # procesos en espera y -1 para el que corre, así un empate no expropia
+        heap = IndexedHeap(n)
+        reloj = 0
+        siguiente = 0 # Próxima llegada por encolar
+        running = -1
+        slice_start = 0
+        timeline = self.new_timeline()
+
         total_wait = 0
         total_turnaround = 0
-        
-        for p in sorted_procs:
-            end_t = t_f[p.pid]
-            turnaround = end_t - p.arrival_time
-            wait = turnaround - p.burst_time
-            total_wait += wait
-            total_turnaround += turnaround
-            
+
+        while siguiente < n or heap:
+            # CPU ociosa: saltar a la siguiente llegada
+            if not heap and sorted_procs[siguiente].arrival_time > reloj:
+                reloj = sorted_procs[siguiente].arrival_time
+
+            while siguiente < n and sorted_procs[siguiente].arrival_time <= reloj:
+                proc = sorted_procs[siguiente]
+                heap.push(siguiente, (self.ready_key(proc, remaining[siguiente], reloj), siguiente))
+                siguiente += 1
+
+            top = heap.peek()
+            if top != running:
+                # Expropiación (o despacho tras una finalización)
+                if running != -1:
+                    timeline.add(sorted_procs[running].pid, slice_start, reloj)
+                    heap.update(running, (self.ready_key(sorted_procs[running], remaining[running], reloj), running))
+                running = top
+                slice_start = reloj
+                heap.update(running, (self.running_key(sorted_procs[running], remaining[running], reloj), -1))
+
+            proc = sorted_procs[running]
+            fin = reloj + remaining[running]
+
+            if siguiente < n and sorted_procs[siguiente].arrival_time < fin:
+                # Próximo evento: una llegada. Descontar lo ejecutado hasta entonces
+                llegada = sorted_procs[siguiente].arrival_time
+                remaining[running] -= llegada - reloj
+                reloj = llegada
+                heap.update(running, (self.running_key(proc, remaining[running], reloj), -1))
+            else:
+                # Próximo evento: finalización del proceso en ejecución
+                timeline.add(proc.pid, slice_start, fin)
+                remaining[running] = 0
+                heap.remove(running)
+                running = -1
+                reloj = fin
+
+                turnaround = fin - proc.arrival_time
+                total_turnaround += turnaround
+                total_wait += turnaround - proc.burst_time
+
         avg_wait = total_wait / n
         avg_turnaround = total_turnaround / n
-        
+
         return timeline, avg_wait, avg_turnaround
 
-class RoundRobinStrategy(CPUSchedulingStrategy):
+class SRTFStrategy(PreemptiveStrategy):
+    # Shortest Remaining Time First: SJF expropiativo
+    def ready_key(self, process: Process, remaining: int, now: int):
+        return remaining
+
+    def running_key(self, process: Process, remaining: int, now: int):
+        return remaining
+
+class PreemptivePriorityStrategy(PreemptiveStrategy):
+    """
+    Prioridad expropiativa con envejecimiento (aging) opcional.
+    Un proceso en espera gana un nivel de prioridad por cada `aging_interval`
+    unidades de tiempo esperadas. Como todos los que esperan envejecen al mismo
+    ritmo, su prioridad efectiva en t es (clave - t) / aging_interval con una
+    clave fija al entrar a la cola (prioridad * aging_interval + ingreso), y
+    el orden relativo no cambia: no hace falta recorrer la cola de listos para
+    envejecerla. La escala entera evita errores de redondeo en los empates.
+    """
+
+    def __init__(self, aging_interval: int = None):
+        self.aging_interval = aging_interval
+
+    def ready_key(self, process: Process, remaining: int, now: int):
+        if not self.aging_interval:
+            return process.priority
+        # Prioridad base escalada + momento de ingreso a la cola
+        return process.priority * self.aging_interval + now
+
+    def running_key(self, process: Process, remaining: int, now: int):
+        # En CPU no envejece: su prioridad efectiva es la base, expresada
+        # en la misma escala que las claves de los que esperan
+        return self.ready_key(process, remaining, now)
+
+class MLFQStrategy(CPUSchedulingStrategy):
+    """
+    Multilevel Feedback Queue.
+    - `levels` colas FIFO (deque), el nivel 0 es el de mayor prioridad.
+    - Cada nivel tiene su quantum (`quanta`); por defecto quantum * 2**nivel.
+    - Un proceso que agota su quantum sin terminar baja un nivel.
+    - Cada `boost_interval` unidades de tiempo todos vuelven al nivel 0.
+    Un bitmap de niveles no vacíos permite elegir el siguiente nivel en O(1)
+    (bit menos significativo encendido), sin importar cuántos niveles haya.
+    Al igual que Round Robin, cada rebanada se ejecuta completa.
+    """
+
+    def __init__(self, levels: int = 3, quanta: List[int] = None, boost_interval: int = None):
+        self.levels = levels
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+
     def schedule(self, processes: List[Process], quantum: int = 2):
-        # Round Robin con Quantum
-        # Necesitamos manejar el estado de ráfaga restante
-        
-        # Estructura auxiliar para manejar burst restante
-        proc_state = {p.pid: {'remaining': p.burst_time, 'arrival': p.arrival_time, 'burst': p.burst_time} for p in processes}
-        
+        quanta = self.quanta or [(quantum or 2) << lvl for lvl in range(self.levels)]
+        levels = len(quanta)
+
         pending = sorted(processes, key=lambda p: p.arrival_time)
-        ready_queue = []
+        n = len(pending)
+        remaining = array('q', (p.burst_time for p in pending))
+
+        queues = [deque() for _ in range(levels)]
+        mask = 0 # Bit i encendido <=> queues[i] no está vacía
+        siguiente = 0 # Próxima llegada por encolar
         current_time = 0
-        timeline = []
-        completed_info = {} # pid -> end_time
-        
-        # Inicialización
-        if pending and pending[0].arrival_time > current_time:
-            current_time = pending[0].arrival_time
+        next_boost = self.boost_interval
+        timeline = self.new_timeline()
 
-        # Cargar iniciales
-        while pending and pending[0].arrival_time <= current_time:
-            ready_queue.append(pending.pop(0))
+        total_wait = 0
+        total_turnaround = 0
 
-        while ready_queue or pending:
-            if not ready_queue:
-                if pending:
-                    current_time = pending[0].arrival_time
-                    while pending and pending[0].arrival_time <= current_time:
-                        ready_queue.append(pending.pop(0))
-                continue
-
-            process = ready_queue.pop(0)
-            pid = process.pid
-            
-            burst_to_do = min(proc_state[pid]['remaining'], quantum)
-            
+        while mask or siguiente < n:
+            if not mask and pending[siguiente].arrival_time > current_time:
+                # CPU ociosa: saltar directo a la siguiente llegada
+                current_time = pending[siguiente].arrival_time
+
+            # Las llegadas entran siempre al nivel 0
+            while siguiente < n and pending[siguiente].arrival_time <= current_time:
+                queues[0].append(siguiente)
+                siguiente += 1
+                mask |= 1
+
+            lvl = (mask & -mask).bit_length() - 1
+            queue = queues[lvl]
+            idx = queue.popleft()
+            if not queue:
+                mask &= ~(1 << lvl)
+
+            burst_to_do = min(remaining[idx], quanta[lvl])
             start_time = current_time
             end_time = start_time + burst_to_do
-            timeline.append({'pid': pid, 'start': start_time, 'end': end_time})
-            
-            proc_state[pid]['remaining'] -= burst_to_do
+            timeline.add(pending[idx].pid, start_time, end_time)
+
+            remaining[idx] -= burst_to_do
             current_time = end_time
-            
-            # Verificar si llegaron nuevos procesos MIENTRAS se ejecutaba este
-            while pending and pending[0].arrival_time <= current_time:
-                ready_queue.append(pending.pop(0))
-            
-            if proc_state[pid]['remaining'] > 0:
-                ready_queue.append(process) # Vuelve a la cola
+
+            # Llegadas ocurridas durante la rebanada
+            while siguiente < n and pending[siguiente].arrival_time <= current_time:
+                queues[0].append(siguiente)
+                siguiente += 1
+                mask |= 1
+
+            if remaining[idx] > 0:
+                # Agotó su quantum: baja un nivel (el último nivel es el piso)
+                lvl = min(lvl + 1, levels - 1)
+                queues[lvl].append(idx)
+                mask |= 1 << lvl
             else:
-                completed_info[pid] = current_time # Terminó
+                turnaround = current_time - pending[idx].arrival_time
+                total_turnaround += turnaround
+                total_wait += turnaround - pending[idx].burst_time
+
+            if next_boost is not None and current_time >= next_boost:
+                # Boost periódico: todas las colas se vacían hacia el nivel 0
+                # conservando el orden por nivel
+                for lvl in range(1, levels):
+                    if mask >> lvl & 1:
+                        queues[0].extend(queues[lvl])
+                        queues[lvl].clear()
+                mask = 1 if mask else 0
+                next_boost += ((current_time - next_boost) // self.boost_interval + 1) * self.boost_interval
+
+        avg_wait = total_wait / n
+        avg_turnaround = total_turnaround / n
 
-        # Calcular métricas finales
-        total_wait = 0
-        total_turnaround = 0
-        
-        for p in processes:
-            end_t = completed_info[p.pid]
-            turnaround = end_t - p.arrival_time
-            wait = turnaround - p.burst_time
-            total_wait += wait
-            total_turnaround += turnaround
-            
-        avg_wait = total_wait / len(processes)
-        avg_turnaround = total_turnaround / len(processes)
-        
         return timeline, avg_wait, avg_turnaround
 
-class PriorityStrategy(CPUSchedulingStrategy):
+class SMPStrategy(CPUSchedulingStrategy):
+    """
+    Planificación multiprocesador (SMP) sobre `cores` núcleos.
+    - Cada núcleo tiene su propia cola de listos (heap) ordenada según la
+      política base: la clave de una NonPreemptiveStrategy (FCFS, SJF,
+      Prioridad) o FIFO con rebanadas de quantum si la base es Round Robin.
+    - Las llegadas se reparten en turno rotativo entre núcleos y un proceso
+      expropiado vuelve a la cola de su núcleo (afinidad).
+    - Work stealing: un núcleo que queda ocioso con su cola vacía roba el
+      mejor proceso de la cola más larga.
+    Dirigido por eventos (llegadas y fin de rebanada por núcleo): el costo
+    crece con los eventos, no con núcleos x ticks.
+    El timeline agrega la clave 'core' a cada tramo del Gantt.
+    """
+
+    def __init__(self, strategy: CPUSchedulingStrategy, cores: int = 2):
+        if not isinstance(strategy, (NonPreemptiveStrategy, RoundRobinStrategy)):
+            raise ValueError(f"SMP no soporta {type(strategy).__name__}")
+        self.strategy = strategy
+        self.cores = cores
+
     def schedule(self, processes: List[Process], quantum: int = None):
-        # Implementación basada en el código PR() del usuario
-        
+        sliced = isinstance(self.strategy, RoundRobinStrategy)
+        if sliced and not quantum:
+            quantum = 2
+
         sorted_procs = sorted(processes, key=lambda p: p.arrival_time)
-        t_0 = [p.arrival_time for p in sorted_procs]
-        t = [p.burst_time for p in sorted_procs]
-        prioridad = [p.priority for p in sorted_procs]
-        pids = [p.pid for p in sorted_procs]
-        
-        reloj = 0
-        r = [] # Índices procesados
-        timeline = []
-        t_f = {}
-        
         n = len(sorted_procs)
-        
-        while len(r) < n:
-            candidatos = []
-            for i in range(n):
-                if i not in r:
-                    if t_0[i] <= reloj:
-                        candidatos.append(i)
-            
-            if candidatos:
-                # candidato = min(candidatos, key=lambda x: prioridad[x])
-                candidato_idx = min(candidatos, key=lambda x: prioridad[x])
-                
-                start_time = reloj
-                burst = t[candidato_idx]
-                end_time = start_time + burst
-                
-                timeline.append({'pid': pids[candidato_idx], 'start': start_time, 'end': end_time})
-                
-                t_f[pids[candidato_idx]] = end_time
-                reloj = end_time
-                r.append(candidato_idx)
-            else:
-                reloj += 1
-                
-        # Métricas
+        cores = self.cores
+        remaining = array('q', (p.burst_time for p in sorted_procs))
+
+        queues = [[] for _ in range(cores)] # Heap por núcleo de (clave, índice)
+        queued = 0 # Total de procesos en colas
+        running = [-1] * cores
+        slice_start = [0] * cores
+        events = [] # Heap de (fin de rebanada, núcleo)
+        idle = list(range(cores)) # Heap de núcleos ociosos
+        seq = 0 # Orden FIFO para Round Robin
+
+        siguiente = 0 # Próxima llegada por encolar
+        done = 0
+        timeline = self.new_timeline(with_core=True)
+
         total_wait = 0
         total_turnaround = 0
-        
-        for p in sorted_procs:
-            end_t = t_f[p.pid]
-            turnaround = end_t - p.arrival_time
-            wait = turnaround - p.burst_time
-            total_wait += wait
-            total_turnaround += turnaround
-            
+
+        while done < n:
+            # Próximo evento: fin de rebanada o llegada (salta los tiempos ociosos)
+            if events and (siguiente >= n or events[0][0] <= sorted_procs[siguiente].arrival_time):
+                reloj = events[0][0]
+            else:
+                reloj = sorted_procs[siguiente].arrival_time
+
+            finished = []
+            while events and events[0][0] == reloj:
+                _, c = heapq.heappop(events)
+                idx = running[c]
+                proc = sorted_procs[idx]
+                timeline.add(proc.pid, slice_start[c], reloj, c)
+                running[c] = -1
+                heapq.heappush(idle, c)
+                if remaining[idx] > 0:
+                    finished.append((c, idx))
+                else:
+                    done += 1
+                    turnaround = reloj - proc.arrival_time
+                    total_turnaround += turnaround
+                    total_wait += turnaround - proc.burst_time
+
+            while siguiente < n and sorted_procs[siguiente].arrival_time <= reloj:
+                key = seq if sliced else self.strategy.ready_key(sorted_procs[siguiente])
+                heapq.heappush(queues[siguiente % cores], (key, siguiente))
+                seq += 1
+                siguiente += 1
+                queued += 1
+
+            # Los expropiados vuelven detrás de las llegadas, como en Round Robin
+            for c, idx in finished:
+                heapq.heappush(queues[c], (seq, idx))
+                seq += 1
+                queued += 1
+
+            # Despacho en los núcleos ociosos
+            while idle and queued:
+                c = heapq.heappop(idle)
+                queue = queues[c]
+                if not queue:
+                    # Work stealing desde la cola más larga
+                    queue = max(queues, key=len)
+                _, idx = heapq.heappop(queue)
+                queued -= 1
+
+                run = remaining[idx]
+                if sliced and run > quantum:
+                    run = quantum
+                remaining[idx] -= run
+                running[c] = idx
+                slice_start[c] = reloj
+                heapq.heappush(events, (reloj + run, c))
+
         avg_wait = total_wait / n
         avg_turnaround = total_turnaround / n
-        
+
         return timeline, avg_wait, avg_turnaround
 
 class CPUScheduler:
-    def __init__(self, strategy: CPUSchedulingStrategy):
+    def __init__(self, strategy: CPUSchedulingStrategy, cores: int = 1, columnar: bool = False):
         self.strategy = strategy
+        self.cores = cores
+        self.columnar = columnar
     
     def set_strategy(self, strategy: CPUSchedulingStrategy):
         self.strategy = strategy
+
+    def set_cores(self, cores: int):
+        # Con más de un núcleo la estrategia se ejecuta en modo SMP
+        self.cores = cores
+        
+    def set_columnar(self, columnar: bool):
+        # Timeline en arreglos tipados (pid, start, end) en lugar de dicts
+        self.columnar = columnar
         
     def run(self, processes: List[Process], quantum: int = None):
-        return self.strategy.schedule(processes, quantum)
+        strategy = self.strategy
+        if self.cores > 1:
+            strategy = SMPStrategy(strategy, self.cores)
+        strategy.columnar = self.columnar
+        return strategy.schedule(processes, quantum)
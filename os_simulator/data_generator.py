@@ -2,7 +2,10 @@ import random
 import json
 from models import Process
 
-def generate_data(num_processes=1000, filename="process_data.json", seed=None):
+# Geometría del disco por defecto (cilindros 0..DISK_CYLINDERS-1)
+DISK_CYLINDERS = 200
+
+def generate_data(num_processes=1000, filename="process_data.json", seed=None, disk_cylinders=DISK_CYLINDERS):
     if seed is not None:
         random.seed(seed)
     
@@ -21,7 +24,6 @@ def generate_data(num_processes=1000, filename="process_data.json", seed=None):
     # Configuración de Memoria y Disco (Mantenemos lógica robusta)
     MAX_PAGES = 20 
     REF_STRING_LENGTH = 15 
-    DISK_CYLINDERS = 200 
     DISK_REQUESTS_COUNT = 5
 
     for i in range(num_processes):
@@ -39,7 +41,7 @@ def generate_data(num_processes=1000, filename="process_data.json", seed=None):
         memory_refs = [random.randint(0, MAX_PAGES) for _ in range(REF_STRING_LENGTH)]
         
         # Peticiones a disco
-        disk_requests = [random.randint(0, DISK_CYLINDERS - 1) for _ in range(DISK_REQUESTS_COUNT)]
+        disk_requests = [random.randint(0, disk_cylinders - 1) for _ in range(DISK_REQUESTS_COUNT)]
 
         # Creamos el objeto Process.
         proc = Process(pid, arrival_time, burst_time, priority, memory_refs, disk_requests, process_size)
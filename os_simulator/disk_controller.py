@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError: # NumPy es opcional: sin él se usan los recorridos en Python
+    np = None
 
 class DiskStrategy(ABC):
     @abstractmethod
@@ -11,6 +18,15 @@ class DiskStrategy(ABC):
 
 class FCFSDiskStrategy(DiskStrategy):
     def execute(self, requests: List[int], start_pos: int) -> Tuple[int, List[int]]:
+        if np is not None and isinstance(requests, np.ndarray):
+            # Camino vectorizado: la secuencia es el cabezal seguido de las
+            # peticiones y el desplazamiento la suma de |diferencias|, sin
+            # recorrer la traza en Python. Retorna la secuencia como ndarray.
+            sequence = np.empty(len(requests) + 1, dtype=np.int64)
+            sequence[0] = start_pos
+            sequence[1:] = requests
+            return int(np.abs(np.diff(sequence)).sum()), sequence
+
         seek_time = 0
         current_pos = start_pos
         sequence = [start_pos]
@@ -24,66 +40,165 @@ class FCFSDiskStrategy(DiskStrategy):
 
 class SSTFStrategy(DiskStrategy):
     def execute(self, requests: List[int], start_pos: int) -> Tuple[int, List[int]]:
+        # Los cilindros distintos se ordenan una vez y forman una lista doblemente
+        # enlazada (arreglos prev/next); el más cercano siempre es el vecino vivo
+        # inmediato a la izquierda o a la derecha del cabezal, así que cada paso
+        # es O(1) y el total O(n log n) por el ordenamiento.
+        # Al llegar a un cilindro se atienden todas sus peticiones (distancia 0).
+        # En un empate de distancia gana el cilindro que aparece primero en
+        # `requests`, igual que min() sobre la lista de pendientes.
         seek_time = 0
         current_pos = start_pos
         sequence = [start_pos]
-        pending = requests.copy()
-        
-        while pending:
-            # Encontrar el más cercano
-            closest_req = min(pending, key=lambda x: abs(x - current_pos))
-            
-            seek_time += abs(closest_req - current_pos)
-            current_pos = closest_req
-            sequence.append(current_pos)
-            pending.remove(closest_req)
-            
+
+        count = {}
+        first = {}
+        for i, req in enumerate(requests):
+            if req in count:
+                count[req] += 1
+            else:
+                count[req] = 1
+                first[req] = i
+        cylinders = sorted(count)
+        n = len(cylinders)
+        prev = array('q', range(-1, n - 1))
+        nxt = array('q', range(1, n + 1))
+
+        right = bisect_left(cylinders, start_pos) # Primer vivo >= cabezal
+        left = right - 1 # Último vivo < cabezal
+        while left >= 0 or right < n:
+            if right >= n:
+                j = left
+            elif left < 0:
+                j = right
+            else:
+                d_left = current_pos - cylinders[left]
+                d_right = cylinders[right] - current_pos
+                if d_left < d_right or (d_left == d_right and first[cylinders[left]] < first[cylinders[right]]):
+                    j = left
+                else:
+                    j = right
+
+            cylinder = cylinders[j]
+            seek_time += abs(cylinder - current_pos)
+            current_pos = cylinder
+            sequence.extend([cylinder] * count[cylinder])
+
+            # Sacar j de la lista: sus vecinos pasan a ser los candidatos
+            left, right = prev[j], nxt[j]
+            if left >= 0:
+                nxt[left] = right
+            if right < n:
+                prev[right] = left
+
         return seek_time, sequence
 
-class SCANStrategy(DiskStrategy):
+class SweepStrategy(DiskStrategy):
+    """
+    Núcleo común de los algoritmos de barrido (SCAN, LOOK, C-SCAN, C-LOOK).
+    Las peticiones se ordenan una sola vez y se parten con bisect en las que
+    quedan por delante del cabezal (según `direction`, "up" o "down") y las
+    que quedan atrás. Cada tramo es monótono, así que su desplazamiento es la
+    distancia entre sus extremos: O(n log n) en total.
+    `cylinders` es la geometría del disco (cilindros 0..cylinders-1).
+    Con `to_edge` el cabezal llega al extremo antes de volver (SCAN/C-SCAN);
+    con `circular` vuelve al otro extremo y atiende en el mismo sentido,
+    contando el retorno como desplazamiento (C-SCAN/C-LOOK).
+    """
+
+    to_edge = True
+    circular = False
+
+    def __init__(self, cylinders: int = 200, direction: str = "up"):
+        if direction not in ("up", "down"):
+            raise ValueError(f"Dirección inválida: {direction}")
+        self.cylinders = cylinders
+        self.direction = direction
+
     def execute(self, requests: List[int], start_pos: int) -> Tuple[int, List[int]]:
-        # Asumimos dirección hacia arriba (incrementando cilindros) por defecto
-        # Rango de disco 0-199 (hardcoded por simplicidad del ejemplo, podría ser paramétrico)
-        DISK_SIZE = 200
-        
+        ordered = sorted(requests)
+        if self.direction == "up":
+            # Las peticiones en la posición inicial se atienden en la primera pasada
+            k = bisect_left(ordered, start_pos)
+            ahead = ordered[k:]
+            behind = ordered[:k] if self.circular else ordered[:k][::-1]
+            edge, far_edge = self.cylinders - 1, 0
+        else:
+            k = bisect_right(ordered, start_pos)
+            ahead = ordered[:k][::-1]
+            behind = ordered[k:][::-1] if self.circular else ordered[k:]
+            edge, far_edge = 0, self.cylinders - 1
+
         seek_time = 0
         current_pos = start_pos
         sequence = [start_pos]
-        
-        # Separar en izquierda y derecha
-        left = [r for r in requests if r < start_pos]
-        right = [r for r in requests if r >= start_pos]
-        
-        # Ordenar
-        left.sort(reverse=True) # Descendente para ir bajando
-        right.sort() # Ascendente para ir subiendo
-        
-        # Ejecución: Subir hasta el final, luego bajar (o viceversa, aquí asumimos subir primero)
-        # SCAN típico va hasta el extremo
-        
-        # 1. Atender derecha
-        for r in right:
-            seek_time += abs(r - current_pos)
-            current_pos = r
-            sequence.append(current_pos)
-            
-        # Si había peticiones a la izquierda, tenemos que ir al extremo derecho primero (199)
-        # Solo si SCAN va hasta el final. Si es LOOK, no va al final.
-        # El prompt pide SCAN (Elevador), que usualmente toca el extremo.
-        if left:
-            if current_pos != DISK_SIZE - 1:
-                seek_time += abs((DISK_SIZE - 1) - current_pos)
-                current_pos = DISK_SIZE - 1
-                sequence.append(current_pos)
-            
-            # 2. Atender izquierda
-            for r in left:
-                seek_time += abs(r - current_pos)
-                current_pos = r
+
+        # 1. Atender lo que está por delante
+        if ahead:
+            seek_time += abs(ahead[-1] - current_pos)
+            current_pos = ahead[-1]
+            sequence.extend(ahead)
+
+        if behind:
+            # Ir al extremo sólo si el algoritmo lo exige (SCAN/C-SCAN)
+            if self.to_edge and current_pos != edge:
+                seek_time += abs(edge - current_pos)
+                current_pos = edge
                 sequence.append(current_pos)
-                
+            # Retorno al otro extremo (C-SCAN) o a la primera petición (C-LOOK)
+            if self.circular:
+                target = far_edge if self.to_edge else behind[0]
+                if current_pos != target:
+                    seek_time += abs(target - current_pos)
+                    current_pos = target
+                    if target != behind[0]:
+                        sequence.append(current_pos)
+
+            # 2. Atender lo que quedó atrás
+            seek_time += abs(behind[0] - current_pos) + abs(behind[-1] - behind[0])
+            current_pos = behind[-1]
+            sequence.extend(behind)
+
         return seek_time, sequence
 
+class SCANStrategy(SweepStrategy):
+    # Elevador: va hasta el extremo y vuelve atendiendo en sentido contrario
+    to_edge = True
+    circular = False
+
+class LOOKStrategy(SweepStrategy):
+    # Como SCAN, pero da la vuelta en la última petición en vez del extremo
+    to_edge = False
+    circular = False
+
+class CSCANStrategy(SweepStrategy):
+    # Va hasta el extremo, salta al extremo opuesto y atiende en el mismo sentido
+    to_edge = True
+    circular = True
+
+class CLOOKStrategy(SweepStrategy):
+    # Como C-SCAN, pero salta de la última petición a la más lejana del otro lado
+    to_edge = False
+    circular = True
+
+def request_array(requests: List[int]):
+    # Peticiones como ndarray int64 (camino vectorizado de FCFS) si hay NumPy
+    if np is None:
+        return requests
+    return np.fromiter(requests, dtype=np.int64, count=len(requests))
+
+def seek_distances(sequence):
+    """
+    Desplazamiento de cada paso de una secuencia de atención (0 en el
+    primero). Con NumPy retorna un ndarray listo para tablas y gráficos.
+    """
+    if np is not None:
+        sequence = np.asarray(sequence, dtype=np.int64)
+        if not len(sequence):
+            return sequence
+        return np.abs(np.diff(sequence, prepend=sequence[0]))
+    return [0] + [abs(b - a) for a, b in zip(sequence, sequence[1:])] if len(sequence) else []
+
 class DiskController:
     def __init__(self, strategy: DiskStrategy):
         self.strategy = strategy
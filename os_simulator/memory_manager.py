@@ -1,30 +1,113 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
+from collections import deque, OrderedDict
+from array import array
+import heapq
 import random
+from structures import FenwickTree, MaxSegmentTree
+from bisect import bisect_left, insort
+
+def next_use_index(pages: List[int]) -> array:
+    """
+    next_use[i] = índice de la próxima referencia a pages[i], o len(pages)
+    si no vuelve a usarse. Una sola pasada hacia atrás, O(n).
+    """
+    n = len(pages)
+    next_use = array('q', bytes(8 * n))
+    last_seen = {}
+    for i in range(n - 1, -1, -1):
+        page = pages[i]
+        next_use[i] = last_seen.get(page, n)
+        last_seen[page] = i
+    return next_use
+
+class FaultCheckpoints:
+    """
+    Historial compacto: guarda (paso, fallos acumulados) cada `every`
+    referencias en arreglos tipados, más el último punto. Para una traza de
+    10M referencias con ~200 puntos ocupa unos KB en lugar de cientos de MB.
+    """
+
+    def __init__(self, every: int):
+        self.every = max(1, every)
+        self.steps = array('q')
+        self.faults = array('q')
+        self.count = 0
+        self.last = 0
+
+    def append(self, faults: int):
+        if self.count % self.every == 0:
+            self.steps.append(self.count)
+            self.faults.append(faults)
+        self.count += 1
+        self.last = faults
+
+    def __len__(self):
+        return self.count
+
+    def points(self) -> Tuple[List[int], List[int]]:
+        steps, faults = list(self.steps), list(self.faults)
+        if self.count and steps[-1] != self.count - 1:
+            steps.append(self.count - 1)
+            faults.append(self.last)
+        return steps, faults
+
+def history_points(history) -> Tuple[List[int], List[int]]:
+    """(pasos, fallos acumulados) listos para graficar, sea cual sea el modo de historial."""
+    if isinstance(history, FaultCheckpoints):
+        return history.points()
+    return list(range(len(history))), list(history)
 
 class MemoryStrategy(ABC):
+    # Modo de historial de fallos:
+    # "list" (lista de ints), "array" (arreglo tipado uint32),
+    # "checkpoints" (FaultCheckpoints cada `history_every` pasos; por defecto
+    # ~200 puntos) o "none" (no se guarda nada)
+    history_mode = "list"
+    history_every = None
+    # Aviso opcional de expulsión (paginación): on_evict(página, fallo) se
+    # llama con la página expulsada y el número de fallo (acumulado) que la
+    # provocó, p. ej. para que una TLB invalide su entrada
+    on_evict = None
+
     @abstractmethod
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
         """
         Retorna: (Page Faults, Hits, History of Faults (cumulative))
+        El tipo del historial depende de `history_mode`.
         """
         pass
 
+    def new_history(self, length: int):
+        if self.history_mode == "array":
+            return array('I')
+        if self.history_mode == "checkpoints":
+            return FaultCheckpoints(self.history_every or length // 200)
+        if self.history_mode == "none":
+            # append de un deque de largo máximo 0 no guarda nada y no cuesta
+            return deque(maxlen=0)
+        return []
+
 class FIFOStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        frames = []
+        # Pertenencia en un set y orden de llegada en un deque: O(1) por referencia
+        frames = set()
+        order = deque()
         faults = 0
         hits = 0
-        history = []
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
         
         for page in pages:
             if page not in frames:
                 faults += 1
-                if len(frames) < frames_count:
-                    frames.append(page)
-                else:
-                    frames.pop(0) # Eliminar el primero (First In)
-                    frames.append(page)
+                if len(frames) >= frames_count:
+                    victim = order.popleft() # Eliminar el primero (First In)
+                    frames.discard(victim)
+                    if on_evict is not None:
+                        on_evict(victim, faults)
+                frames.add(page)
+                order.append(page)
             else:
                 hits += 1
             history.append(faults)
@@ -33,92 +116,330 @@ class FIFOStrategy(MemoryStrategy):
 
 class LRUStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        frames = [] 
+        # OrderedDict: pertenencia por hash y orden de uso (el menos reciente primero)
+        frames = OrderedDict()
         faults = 0
         hits = 0
-        history = []
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
         
         for page in pages:
             if page not in frames:
                 faults += 1
-                if len(frames) < frames_count:
-                    frames.append(page)
-                else:
-                    frames.pop(0) 
-                    frames.append(page)
+                if len(frames) >= frames_count:
+                    victim, _ = frames.popitem(last=False)
+                    if on_evict is not None:
+                        on_evict(victim, faults)
+                frames[page] = None
             else:
                 hits += 1
-                frames.remove(page)
-                frames.append(page)
+                frames.move_to_end(page)
             history.append(faults)
                 
         return faults, hits, history
 
 class OptimalStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        frames = []
+        # Belady: se reemplaza la página cuyo próximo uso está más lejos.
+        # next_use se precalcula en una sola pasada hacia atrás y la víctima sale
+        # de un max-heap por próximo uso (entradas obsoletas se descartan al
+        # sacarlas). Costo total O(n log marcos).
+        next_use = next_use_index(pages)
+
+        frames = {} # página residente -> próximo uso vigente
+        heap = [] # (-próximo uso, página)
         faults = 0
         hits = 0
-        history = []
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
         
         for i, page in enumerate(pages):
             if page not in frames:
                 faults += 1
-                if len(frames) < frames_count:
-                    frames.append(page)
-                else:
-                    farthest_idx = -1
-                    victim_frame = -1
-                    
-                    for frame in frames:
-                        try:
-                            next_use = pages[i+1:].index(frame)
-                        except ValueError:
-                            next_use = float('inf')
-                        
-                        if next_use > farthest_idx:
-                            farthest_idx = next_use
-                            victim_frame = frame
-                    
-                    frames.remove(victim_frame)
-                    frames.append(page)
+                if len(frames) >= frames_count:
+                    while True:
+                        neg_use, victim = heapq.heappop(heap)
+                        if frames.get(victim) == -neg_use:
+                            break
+                    del frames[victim]
+                    if on_evict is not None:
+                        on_evict(victim, faults)
             else:
                 hits += 1
+            frames[page] = next_use[i]
+            heapq.heappush(heap, (-next_use[i], page))
+
+            # Compactar el heap si las entradas obsoletas se acumulan
+            if len(heap) > 2 * frames_count + 16:
+                heap = [(-use, p) for p, use in frames.items()]
+                heapq.heapify(heap)
             history.append(faults)
                 
         return faults, hits, history
 
+class ClockStrategy(MemoryStrategy):
+    def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
+        # Reloj (segunda oportunidad): los marcos forman un anillo con un bit de
+        # referencia por marco (bytearray). La manecilla limpia bits hasta dar
+        # con uno en 0; cada bit limpiado lo puso una referencia, así que el
+        # costo amortizado es O(1) por referencia.
+        slot_page = [None] * frames_count
+        ref = bytearray(frames_count)
+        page_slot = {}
+        hand = 0
+        used = 0
+        faults = 0
+        hits = 0
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
+
+        for page in pages:
+            slot = page_slot.get(page)
+            if slot is not None:
+                hits += 1
+                ref[slot] = 1
+            else:
+                faults += 1
+                if used < frames_count:
+                    slot = used
+                    used += 1
+                else:
+                    while ref[hand]:
+                        ref[hand] = 0
+                        hand = (hand + 1) % frames_count
+                    slot = hand
+                    hand = (hand + 1) % frames_count
+                    del page_slot[slot_page[slot]]
+                    if on_evict is not None:
+                        on_evict(slot_page[slot], faults)
+                slot_page[slot] = page
+                page_slot[page] = slot
+                ref[slot] = 1
+            history.append(faults)
+
+        return faults, hits, history
+
+class EnhancedSecondChanceStrategy(MemoryStrategy):
+    """
+    Segunda oportunidad mejorada: bits de referencia (R) y modificación (M)
+    en bytearrays. La manecilla reemplaza el primer marco (0, 0); a un marco
+    con R = 1 le limpia R y a uno (0, 1) lo escribe a disco (write-back) y le
+    limpia M. Cada paso de la manecilla consume un bit puesto por una
+    referencia o una escritura: O(1) amortizado por referencia.
+    Las trazas no distinguen lecturas de escrituras, así que cada referencia
+    es escritura con probabilidad `write_ratio` (semilla fija).
+    `writebacks` queda con la cantidad de páginas sucias escritas a disco.
+    """
+
+    def __init__(self, write_ratio: float = 0.3, seed: int = 42):
+        self.write_ratio = write_ratio
+        self.seed = seed
+        self.writebacks = 0
+
+    def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
+        rnd = random.Random(self.seed)
+        slot_page = [None] * frames_count
+        ref = bytearray(frames_count)
+        mod = bytearray(frames_count)
+        page_slot = {}
+        hand = 0
+        used = 0
+        faults = 0
+        hits = 0
+        writebacks = 0
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
+
+        for page in pages:
+            write = rnd.random() < self.write_ratio
+            slot = page_slot.get(page)
+            if slot is not None:
+                hits += 1
+            else:
+                faults += 1
+                if used < frames_count:
+                    slot = used
+                    used += 1
+                else:
+                    while ref[hand] or mod[hand]:
+                        if ref[hand]:
+                            ref[hand] = 0
+                        else:
+                            mod[hand] = 0
+                            writebacks += 1
+                        hand = (hand + 1) % frames_count
+                    slot = hand
+                    hand = (hand + 1) % frames_count
+                    del page_slot[slot_page[slot]]
+                    if on_evict is not None:
+                        on_evict(slot_page[slot], faults)
+                slot_page[slot] = page
+                page_slot[page] = slot
+            ref[slot] = 1
+            if write:
+                mod[slot] = 1
+            history.append(faults)
+
+        # Las páginas sucias que siguen en memoria también se escriben al final
+        self.writebacks = writebacks + sum(mod)
+        return faults, hits, history
+
+class LFUStrategy(MemoryStrategy):
+    def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
+        # LFU en O(1): cubetas por frecuencia (OrderedDict, así el empate se
+        # resuelve por LRU) y la frecuencia mínima vigente. La frecuencia de
+        # una página se pierde al expulsarla.
+        freq = {}
+        buckets = {}
+        min_freq = 0
+        faults = 0
+        hits = 0
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
+
+        for page in pages:
+            f = freq.get(page)
+            if f is not None:
+                hits += 1
+                bucket = buckets[f]
+                del bucket[page]
+                if not bucket:
+                    del buckets[f]
+                    if min_freq == f:
+                        min_freq = f + 1
+                freq[page] = f + 1
+                buckets.setdefault(f + 1, OrderedDict())[page] = None
+            else:
+                faults += 1
+                if len(freq) >= frames_count:
+                    bucket = buckets[min_freq]
+                    victim, _ = bucket.popitem(last=False)
+                    if not bucket:
+                        del buckets[min_freq]
+                    del freq[victim]
+                    if on_evict is not None:
+                        on_evict(victim, faults)
+                freq[page] = 1
+                buckets.setdefault(1, OrderedDict())[page] = None
+                min_freq = 1
+            history.append(faults)
+
+        return faults, hits, history
+
+class AgingStrategy(MemoryStrategy):
+    """
+    Aging (NFU con envejecimiento): cada marco tiene un contador de 8 bits y
+    un bit R (bytearrays). Cada `period` referencias (tick de reloj) los
+    contadores se desplazan a la derecha y R entra por el bit más alto.
+    Se expulsa la página de menor contador. Como los contadores sólo cambian
+    en los ticks, los marcos se agrupan en 256 cubetas por valor y un bitmap
+    de cubetas no vacías da la mínima en O(1). El tick cuesta O(marcos); con
+    el período por defecto (= marcos) el costo es O(1) amortizado.
+    La carga cuenta una sola vez, como referencia de su propio intervalo:
+    contador 0 y R = 1 (0x80 tras el tick), pero hasta el tick el marco se
+    ubica en la cubeta 0x80 y no es la víctima inmediata. Con 3 marcos y
+    período 3, en A B C | A B A | D A A | E la víctima de E es B (0x60)
+    y no D (0x80), cargada en el último intervalo:
+
+    >>> AgingStrategy(period=3).simulate(list("ABCABADAAE") + ["D"], 3)[:2]
+    (5, 6)
+    >>> AgingStrategy(period=3).simulate(list("ABCABADAAE") + ["B"], 3)[:2]
+    (6, 5)
+    """
+
+    def __init__(self, period: int = None):
+        self.period = period
+
+    def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
+        period = self.period or max(frames_count, 1)
+        slot_page = [None] * frames_count
+        ref = bytearray(frames_count)
+        counter = bytearray(frames_count)
+        buckets = [{} for _ in range(256)] # valor del contador -> marcos (orden de llegada)
+        mask = 0
+        page_slot = {}
+        used = 0
+        faults = 0
+        hits = 0
+        history = self.new_history(len(pages))
+        on_evict = self.on_evict
+
+        for i, page in enumerate(pages):
+            slot = page_slot.get(page)
+            if slot is not None:
+                hits += 1
+                ref[slot] = 1
+            else:
+                faults += 1
+                if used < frames_count:
+                    slot = used
+                    used += 1
+                else:
+                    value = (mask & -mask).bit_length() - 1
+                    bucket = buckets[value]
+                    slot = next(iter(bucket))
+                    del bucket[slot]
+                    if not bucket:
+                        mask &= ~(1 << value)
+                    del page_slot[slot_page[slot]]
+                    if on_evict is not None:
+                        on_evict(slot_page[slot], faults)
+                slot_page[slot] = page
+                page_slot[page] = slot
+                # La carga es la referencia de este intervalo: contador 0 y R = 1,
+                # así el tick la deja en 0x80. Hasta el tick el marco va en la
+                # cubeta 0x80 para que no sea la víctima inmediata
+                counter[slot] = 0
+                ref[slot] = 1
+                buckets[0x80][slot] = None
+                mask |= 1 << 0x80
+
+            if (i + 1) % period == 0:
+                # Tick: envejecer todos los contadores y reconstruir las cubetas
+                while mask:
+                    value = (mask & -mask).bit_length() - 1
+                    buckets[value].clear()
+                    mask &= mask - 1
+                for s in range(used):
+                    value = (counter[s] >> 1) | (ref[s] << 7)
+                    counter[s] = value
+                    ref[s] = 0
+                    buckets[value][s] = None
+                    mask |= 1 << value
+            history.append(faults)
+
+        return faults, hits, history
+
+def _partition_workload(pages: List[int], frames_count: int, process_sizes: List[int] = None):
+    # Bloques de memoria fijos y tamaños de proceso (aleatorios con semilla 42
+    # si no se entregan) comunes a las estrategias de partición
+    random.seed(42)
+    
+    memory_blocks = [100, 200, 50, 150, 300, 120, 80, 250] * (frames_count // 8 + 1)
+    memory_blocks = memory_blocks[:frames_count]
+    
+    if process_sizes is None:
+        process_sizes = [random.randint(10, 90) for _ in range(len(pages))]
+    return memory_blocks, process_sizes
+
 class BestFitStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        random.seed(42)
-        
-        memory_blocks = [100, 200, 50, 150, 300, 120, 80, 250] * (frames_count // 8 + 1)
-        memory_blocks = memory_blocks[:frames_count]
+        memory_blocks, process_sizes = _partition_workload(pages, frames_count, process_sizes)
         
-        if process_sizes is None:
-            process_sizes = [random.randint(10, 90) for _ in range(len(pages))]
-        
-        espacio_restante = memory_blocks[:]
+        # Índice ordenado por espacio libre: (restante, bloque). El mejor ajuste
+        # es el primer par >= (tamaño, -1): menor despilfarro y, a igualdad, el
+        # bloque de menor índice. Búsqueda O(log bloques) con bisect.
+        por_espacio = sorted((libre, j) for j, libre in enumerate(memory_blocks))
         asignados = 0
         fallos_asignacion = 0
-        history = []
-        
-        limit = min(len(process_sizes), 1000)
+        history = self.new_history(len(process_sizes))
         
-        for i in range(limit):
-            proceso_size = process_sizes[i]
-            mejor_bloque = -1
-            menor_despilfarro = float('inf')
+        for proceso_size in process_sizes:
+            k = bisect_left(por_espacio, (proceso_size, -1))
             
-            for j, bloque in enumerate(espacio_restante):
-                if bloque >= proceso_size:
-                    despilfarro = bloque - proceso_size
-                    if despilfarro < menor_despilfarro:
-                        mejor_bloque = j
-                        menor_despilfarro = despilfarro
-            
-            if mejor_bloque != -1:
-                espacio_restante[mejor_bloque] -= proceso_size
+            if k < len(por_espacio):
+                libre, mejor_bloque = por_espacio.pop(k)
+                insort(por_espacio, (libre - proceso_size, mejor_bloque))
                 asignados += 1
             else:
                 fallos_asignacion += 1
@@ -129,34 +450,20 @@ class BestFitStrategy(MemoryStrategy):
 
 class WorstFitStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        random.seed(42) 
-        
-        memory_blocks = [100, 200, 50, 150, 300, 120, 80, 250] * (frames_count // 8 + 1)
-        memory_blocks = memory_blocks[:frames_count]
+        memory_blocks, process_sizes = _partition_workload(pages, frames_count, process_sizes)
         
-        if process_sizes is None:
-            process_sizes = [random.randint(10, 90) for _ in range(len(pages))]
-        
-        espacio_restante = memory_blocks[:]
+        # Max-heap por espacio libre (a igualdad, menor índice). Sólo cambia el
+        # bloque del tope, así que el heap nunca tiene entradas obsoletas.
+        mayores = [(-libre, j) for j, libre in enumerate(memory_blocks)]
+        heapq.heapify(mayores)
         asignados = 0
         fallos_asignacion = 0
-        history = []
-        
-        limit = min(len(process_sizes), 1000)
+        history = self.new_history(len(process_sizes))
         
-        for i in range(limit):
-            proceso_size = process_sizes[i]
-            peor_bloque = -1
-            mayor_espacio = -1
-            
-            for j, bloque in enumerate(espacio_restante):
-                if bloque >= proceso_size:
-                    if bloque > mayor_espacio:
-                        peor_bloque = j
-                        mayor_espacio = bloque
-            
-            if peor_bloque != -1:
-                espacio_restante[peor_bloque] -= proceso_size
+        for proceso_size in process_sizes:
+            if mayores and -mayores[0][0] >= proceso_size:
+                neg_libre, peor_bloque = mayores[0]
+                heapq.heapreplace(mayores, (neg_libre + proceso_size, peor_bloque))
                 asignados += 1
             else:
                 fallos_asignacion += 1
@@ -167,33 +474,22 @@ class WorstFitStrategy(MemoryStrategy):
 
 class FirstFitStrategy(MemoryStrategy):
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        random.seed(42) 
+        memory_blocks, process_sizes = _partition_workload(pages, frames_count, process_sizes)
         
-        memory_blocks = [100, 200, 50, 150, 300, 120, 80, 250] * (frames_count // 8 + 1)
-        memory_blocks = memory_blocks[:frames_count]
-        
-        if process_sizes is None:
-            process_sizes = [random.randint(10, 90) for _ in range(len(pages))]
-        
-        espacio_restante = memory_blocks[:]
+        # Árbol de segmentos de máximos: el primer bloque con espacio suficiente
+        # se encuentra en O(log bloques)
+        espacio_restante = MaxSegmentTree(memory_blocks)
         asignados = 0
         fallos_asignacion = 0
-        history = []
+        history = self.new_history(len(process_sizes))
         
-        limit = min(len(process_sizes), 1000)
-        
-        for i in range(limit):
-            proceso_size = process_sizes[i]
-            asignado = False
-            
-            for j, bloque in enumerate(espacio_restante):
-                if bloque >= proceso_size:
-                    espacio_restante[j] -= proceso_size
-                    asignados += 1
-                    asignado = True
-                    break
+        for proceso_size in process_sizes:
+            j = espacio_restante.first_at_least(proceso_size)
             
-            if not asignado:
+            if j != -1:
+                espacio_restante.update(j, espacio_restante[j] - proceso_size)
+                asignados += 1
+            else:
                 fallos_asignacion += 1
             
             history.append(fallos_asignacion)
@@ -201,57 +497,355 @@ class FirstFitStrategy(MemoryStrategy):
         return fallos_asignacion, asignados, history
 
 class RelocatablePartitionStrategy(MemoryStrategy):
+    """
+    Particiones reubicables: primer ajuste y, si ningún bloque alcanza pero el
+    espacio libre total sí, se compacta. Cada bloque guarda sus asignaciones
+    al inicio y su hueco al final; compactar desliza las asignaciones de
+    bloques enteros para fusionar huecos vecinos, y su costo se contabiliza:
+    - `bytes_relocated`: MB movidos; `allocations_moved`: asignaciones movidas;
+      `compactions`: cantidad de compactaciones.
+    Políticas (`policy`):
+    - "full": todo el espacio libre pasa al bloque 0 (comportamiento original).
+    - "incremental": parte del hueco más grande y lo extiende hacia el vecino
+      cuyo movimiento es más barato, deteniéndose en cuanto el hueco alcanza.
+      Costo O(bloques fusionados * log bloques) en lugar de O(bloques).
+    """
+
+    def __init__(self, policy: str = "full"):
+        self.policy = policy
+        self.bytes_relocated = 0
+        self.allocations_moved = 0
+        self.compactions = 0
+
     def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
-        random.seed(42) 
+        memory_blocks, process_sizes = _partition_workload(pages, frames_count, process_sizes)
         
-        memory_blocks = [100, 200, 50, 150, 300, 120, 80, 250] * (frames_count // 8 + 1)
-        memory_blocks = memory_blocks[:frames_count]
-        
-        if process_sizes is None:
-            process_sizes = [random.randint(10, 90) for _ in range(len(pages))]
-        
-        espacio_restante = memory_blocks[:]
+        espacio_restante = MaxSegmentTree(memory_blocks)
+        usado = [0] * len(memory_blocks) # MB asignados en cada bloque
+        asignaciones = [0] * len(memory_blocks) # Asignaciones en cada bloque
+        total_libre = sum(memory_blocks)
         asignados = 0
         fallos_asignacion = 0
-        history = []
+        history = self.new_history(len(process_sizes))
+        self.bytes_relocated = 0
+        self.allocations_moved = 0
+        self.compactions = 0
         
-        limit = min(len(process_sizes), 1000)
-        
-        for i in range(limit):
-            proceso_size = process_sizes[i]
-            asignado = False
-            
-            for j, bloque in enumerate(espacio_restante):
-                if bloque >= proceso_size:
-                    espacio_restante[j] -= proceso_size
-                    asignados += 1
-                    asignado = True
-                    break
+        for proceso_size in process_sizes:
+            j = espacio_restante.first_at_least(proceso_size)
             
-            if not asignado:
-                total_libre = sum(espacio_restante)
-                if total_libre >= proceso_size:
-                    espacio_restante = [0] * len(espacio_restante)
-                    espacio_restante[0] = total_libre
-                    
-                    if espacio_restante[0] >= proceso_size:
-                        espacio_restante[0] -= proceso_size
-                        asignados += 1
-                        asignado = True
+            if j == -1 and total_libre >= proceso_size:
+                self.compactions += 1
+                if self.policy == "incremental":
+                    espacio_restante, j = self._compact_incremental(espacio_restante, usado, asignaciones, proceso_size)
+                else:
+                    espacio_restante, j = self._compact_full(espacio_restante, usado, asignaciones, total_libre)
             
-            if not asignado:
+            if j != -1:
+                espacio_restante.update(j, espacio_restante[j] - proceso_size)
+                usado[j] += proceso_size
+                asignaciones[j] += 1
+                total_libre -= proceso_size
+                asignados += 1
+            else:
                 fallos_asignacion += 1
             
             history.append(fallos_asignacion)
             
         return fallos_asignacion, asignados, history
 
+    def _compact_full(self, espacio_restante: MaxSegmentTree, usado: List[int], asignaciones: List[int], total_libre: int):
+        # Todo el espacio libre pasa al bloque 0: el contenido de cada bloque
+        # j >= 1 se desplaza hacia el final si hay huecos desde j en adelante
+        libre_desde = 0
+        for j in range(len(usado) - 1, 0, -1):
+            libre_desde += espacio_restante[j]
+            if libre_desde > 0 and usado[j] > 0:
+                self.bytes_relocated += usado[j]
+                self.allocations_moved += asignaciones[j]
+        compactado = [0] * len(usado)
+        compactado[0] = total_libre
+        return MaxSegmentTree(compactado), 0
+
+    def _compact_incremental(self, espacio_restante: MaxSegmentTree, usado: List[int], asignaciones: List[int], proceso_size: int):
+        # Ventana de huecos [izq, der] fusionados al final del bloque `der`:
+        # cuesta mover el contenido de los bloques izq+1..der
+        der = izq = espacio_restante.first_at_least(espacio_restante.max())
+        libre = espacio_restante[der]
+        ultimo = len(usado) - 1
+        while libre < proceso_size:
+            if izq > 0 and (der == ultimo or usado[izq] <= usado[der + 1]):
+                movido = izq
+                izq -= 1
+                libre += espacio_restante[izq]
+            else:
+                der += 1
+                movido = der
+                libre += espacio_restante[der]
+            self.bytes_relocated += usado[movido]
+            self.allocations_moved += asignaciones[movido]
+        for j in range(izq, der):
+            espacio_restante.update(j, 0)
+        espacio_restante.update(der, libre)
+        return espacio_restante, der
+
+class TLBStrategy(MemoryStrategy):
+    """
+    TLB delante de cualquier estrategia de paginación.
+    - `size` entradas organizadas en conjuntos de `associativity` vías
+      (por defecto totalmente asociativa); conjunto = página % conjuntos.
+      `associativity` debe dividir a `size` (si no, ValueError).
+    - Reemplazo dentro del conjunto: "LRU", "FIFO" o "Random".
+    La estrategia envuelta decide los fallos de página (se lee de su historial
+    como arreglo) y avisa cada expulsión por `on_evict`: la entrada de la
+    página expulsada se invalida en ese fallo, así no ocupa una vía que
+    podría usar una traducción válida. Una referencia que falla siempre es
+    fallo de TLB. O(1) adicional por referencia.
+    Tiempo efectivo de acceso (ns): TLB + memoria en un acierto, más
+    `page_table_levels` accesos a memoria en un fallo de TLB y `fault_time`
+    en un fallo de página. Resultados en `tlb_hits`, `tlb_misses`,
+    `tlb_hit_rate` y `effective_access_time`.
+    """
+
+    def __init__(self, strategy: MemoryStrategy, size: int = 64, associativity: int = None,
+                 policy: str = "LRU", tlb_time: float = 1, memory_time: float = 100,
+                 fault_time: float = 8_000_000, page_table_levels: int = 1, seed: int = 42):
+        associativity = associativity or size
+        if size < 1 or associativity < 1 or size % associativity:
+            raise ValueError(f"La asociatividad ({associativity}) debe dividir el tamaño de la TLB ({size})")
+        self.strategy = strategy
+        self.size = size
+        self.associativity = associativity
+        self.policy = policy
+        self.tlb_time = tlb_time
+        self.memory_time = memory_time
+        self.fault_time = fault_time
+        self.page_table_levels = page_table_levels
+        self.seed = seed
+        self.tlb_hits = 0
+        self.tlb_misses = 0
+        self.tlb_hit_rate = 0.0
+        self.effective_access_time = 0.0
+
+    def simulate(self, pages: List[int], frames_count: int, process_sizes: List[int] = None) -> Tuple[int, int, List[int]]:
+        # Expulsiones en orden de fallo: (fallo, página)
+        evictions = []
+        self.strategy.history_mode = "array"
+        self.strategy.on_evict = lambda page, fault: evictions.append((fault, page))
+        faults, hits, page_history = self.strategy.simulate(pages, frames_count, process_sizes)
+        self.strategy.on_evict = None
+
+        ways = self.associativity
+        num_sets = self.size // ways
+        sets = [OrderedDict() for _ in range(num_sets)]
+        slots = [[] for _ in range(num_sets)] # Para el reemplazo aleatorio en O(1)
+        where = {} # página -> posición en slots (reemplazo aleatorio)
+        rnd = random.Random(self.seed)
+        lru = self.policy == "LRU"
+        aleatorio = self.policy == "Random"
+
+        tlb_hits = 0
+        previous = 0
+        pending = 0
+        history = self.new_history(len(pages))
+
+        for i, page in enumerate(pages):
+            cumulative = page_history[i]
+            fault = cumulative != previous
+            previous = cumulative
+            history.append(cumulative)
+
+            # Invalidar la entrada de la página que este fallo expulsó
+            while pending < len(evictions) and evictions[pending][0] == cumulative:
+                victim = evictions[pending][1]
+                pending += 1
+                vs = victim % num_sets
+                if victim in sets[vs]:
+                    del sets[vs][victim]
+                    if aleatorio:
+                        victims = slots[vs]
+                        k = where.pop(victim)
+                        last = victims.pop()
+                        if last != victim:
+                            victims[k] = last
+                            where[last] = k
+
+            s = page % num_sets
+            entries = sets[s]
+            if page in entries:
+                # Con fallo sólo si la estrategia no avisa sus expulsiones:
+                # la entrada se renueva pero no es acierto
+                if not fault:
+                    tlb_hits += 1
+                if lru:
+                    entries.move_to_end(page)
+                continue
+            if len(entries) >= ways:
+                if aleatorio:
+                    victims = slots[s]
+                    k = rnd.randrange(len(victims))
+                    victim = victims[k]
+                    victims[k] = page
+                    del where[victim]
+                    where[page] = k
+                    del entries[victim]
+                    entries[page] = None
+                    continue
+                entries.popitem(last=False)
+            entries[page] = None
+            if aleatorio:
+                where[page] = len(slots[s])
+                slots[s].append(page)
+
+        n = len(pages)
+        self.tlb_hits = tlb_hits
+        self.tlb_misses = n - tlb_hits
+        self.tlb_hit_rate = tlb_hits / n if n else 0.0
+        walk = self.page_table_levels * self.memory_time
+        total_time = n * (self.tlb_time + self.memory_time) + self.tlb_misses * walk + faults * self.fault_time
+        self.effective_access_time = total_time / n if n else 0.0
+
+        return faults, hits, history
+
+# --- Curvas de fallos para todos los tamaños de memoria en una pasada ---
+
+def lru_fault_curve(pages: List[int], max_frames: int = None) -> List[int]:
+    """
+    Fallos de LRU para 1..max_frames marcos en una sola pasada (Mattson).
+    La distancia de pila de una referencia es la cantidad de páginas distintas
+    usadas desde su referencia anterior (+1); un árbol de Fenwick con un 1 en
+    la última aparición de cada página la entrega en O(log n). Con F marcos
+    una referencia falla si su distancia es > F. Total O(n log n).
+    """
+    if max_frames is None:
+        max_frames = len(set(pages))
+    n = len(pages)
+    bit = FenwickTree(n)
+    last_seen = {}
+    cold = 0
+    by_distance = [0] * (max_frames + 2) # by_distance[max_frames + 1] = "más lejos"
+
+    for i, page in enumerate(pages):
+        j = last_seen.get(page)
+        if j is None:
+            cold += 1
+        else:
+            distance = bit.prefix_sum(i) - bit.prefix_sum(j + 1) + 1
+            by_distance[min(distance, max_frames + 1)] += 1
+            bit.add(j, -1)
+        bit.add(i, 1)
+        last_seen[page] = i
+
+    return _curve_from_distances(by_distance, cold, max_frames)
+
+def optimal_fault_curve(pages: List[int], max_frames: int = None) -> List[int]:
+    """
+    Fallos de Óptimo (Belady) para 1..max_frames marcos en una sola pasada.
+    OPT es un algoritmo de pila: se mantiene la pila de prioridades de Mattson
+    (prioridad = próximo uso) y la distancia de cada referencia es su
+    profundidad en esa pila. Costo O(n * páginas distintas).
+    """
+    if max_frames is None:
+        max_frames = len(set(pages))
+    next_use = next_use_index(pages)
+    stack = [] # Páginas, la de mayor prioridad arriba (índice 0)
+    priority = {} # página -> próximo uso
+    cold = 0
+    by_distance = [0] * (max_frames + 2)
+
+    for i, page in enumerate(pages):
+        if page in priority:
+            depth = stack.index(page)
+            by_distance[min(depth + 1, max_frames + 1)] += 1
+        else:
+            cold += 1
+            depth = len(stack)
+            stack.append(page)
+        priority[page] = next_use[i]
+
+        # La página referenciada sube al tope; entre el tope y su antigua
+        # posición, la de próximo uso más lejano se desplaza hacia abajo
+        if depth > 0:
+            carry = stack[0]
+            stack[0] = page
+            for k in range(1, depth):
+                current = stack[k]
+                if priority[carry] < priority[current]:
+                    stack[k] = carry
+                    carry = current
+            stack[depth] = carry
+
+    return _curve_from_distances(by_distance, cold, max_frames)
+
+def fifo_fault_curve(pages: List[int], max_frames: int = None) -> List[int]:
+    """
+    Fallos de FIFO para 1..max_frames marcos. FIFO no es un algoritmo de pila
+    (anomalía de Belady), así que se simula cada tamaño con la versión O(1)
+    por referencia; a partir de tantos marcos como páginas distintas sólo hay
+    fallos de arranque en frío y no hace falta simular.
+    """
+    distinct = len(set(pages))
+    if max_frames is None:
+        max_frames = distinct
+    curve = []
+    for frames_count in range(1, max_frames + 1):
+        if frames_count >= distinct:
+            curve.append(distinct)
+            continue
+        frames = set()
+        order = deque()
+        faults = 0
+        for page in pages:
+            if page not in frames:
+                faults += 1
+                if len(frames) >= frames_count:
+                    frames.discard(order.popleft())
+                frames.add(page)
+                order.append(page)
+        curve.append(faults)
+    return curve
+
+def _curve_from_distances(by_distance: List[int], cold: int, max_frames: int) -> List[int]:
+    # faults[F] = fallos en frío + referencias con distancia > F
+    curve = [0] * max_frames
+    farther = by_distance[max_frames + 1]
+    for frames_count in range(max_frames, 0, -1):
+        curve[frames_count - 1] = cold + farther
+        farther += by_distance[frames_count]
+    return curve
+
+def allocate_frames(weights: List[float], total_frames: int) -> List[int]:
+    """
+    Reparte `total_frames` en proporción a `weights` (método del mayor resto).
+    Todo proceso con peso > 0 recibe al menos 1 marco, por lo que con más
+    procesos que marcos el total asignado puede superar a `total_frames`.
+    """
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        return [0] * len(weights)
+    shares = [total_frames * w / total_weight for w in weights]
+    frames = [int(s) for s in shares]
+    remaining = total_frames - sum(frames)
+    by_remainder = sorted(range(len(weights)), key=lambda i: frames[i] - shares[i])
+    for i in by_remainder[:max(0, remaining)]:
+        frames[i] += 1
+    return [max(1, f) if w > 0 else 0 for f, w in zip(frames, weights)]
+
 class MemoryManager:
-    def __init__(self, strategy: MemoryStrategy):
+    def __init__(self, strategy: MemoryStrategy, history_mode: str = "list", history_every: int = None):
         self.strategy = strategy
+        self.history_mode = history_mode
+        self.history_every = history_every
         
     def set_strategy(self, strategy: MemoryStrategy):
         self.strategy = strategy
+
+    def set_history(self, mode: str, every: int = None):
+        # "list", "array", "checkpoints" o "none" (ver MemoryStrategy)
+        self.history_mode = mode
+        self.history_every = every
         
     def run(self, pages: List[int], frames_count: int, process_sizes: List[int] = None):
+        self.strategy.history_mode = self.history_mode
+        self.strategy.history_every = self.history_every
         return self.strategy.simulate(pages, frames_count, process_sizes)
@@ -0,0 +1,176 @@
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List
+from models import Process
+from timeline import iter_slices
+
+class QuantileSketch:
+    """
+    Sketch de cuantiles en streaming (estilo DDSketch): agrupa los valores en
+    cubetas logarítmicas de razón gamma = (1 + a) / (1 - a), así cualquier
+    cuantil se estima con error relativo <= a usando memoria O(log(max/min)),
+    sin guardar los valores. Los ceros (p. ej. esperas nulas) van aparte.
+    Dos sketches con la misma precisión se pueden combinar con `merge`.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zeros += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: 'QuantileSketch'):
+        for key, c in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + c
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return max(self.min, 0)
+        seen = self.zeros
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Punto medio (relativo) de la cubeta, acotado por el máximo real
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(estimate, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'avg': self.mean,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'max': self.max if self.count else 0,
+        }
+
+@dataclass
+class CPUMetrics:
+    # Vectores por proceso, en el orden de la lista de procesos (None si no se guardan)
+    wait: array = None
+    turnaround: array = None
+    response: array = None
+    # Distribuciones en streaming
+    wait_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    turnaround_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    response_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    completed: int = 0
+    makespan: int = 0
+    busy_time: int = 0
+    cores: int = 1
+    context_switches: int = 0
+
+    @property
+    def throughput(self) -> float:
+        # Procesos completados por unidad de tiempo
+        return self.completed / self.makespan if self.makespan else 0.0
+
+    @property
+    def utilization(self) -> float:
+        # Fracción del tiempo en que los núcleos estuvieron ocupados
+        return self.busy_time / (self.makespan * self.cores) if self.makespan else 0.0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            'wait': self.wait_sketch.summary(),
+            'turnaround': self.turnaround_sketch.summary(),
+            'response': self.response_sketch.summary(),
+        }
+
+def compute_cpu_metrics(processes: List[Process], timeline, cores: int = None,
+                        keep_vectors: bool = True, relative_accuracy: float = 0.01) -> CPUMetrics:
+    """
+    Calcula las métricas de una corrida de CPU en una sola pasada por el timeline.
+    Un proceso se completa cuando el tiempo servido alcanza su ráfaga; en ese
+    evento se registran su espera, retorno y respuesta (primer despacho - llegada).
+    `cores` por defecto se deduce de la columna 'core' del timeline.
+    """
+    n = len(processes)
+    index = {p.pid: i for i, p in enumerate(processes)}
+    served = array('q', bytes(8 * n))
+    first_start = array('q', [-1]) * n
+
+    metrics = CPUMetrics(
+        wait_sketch=QuantileSketch(relative_accuracy),
+        turnaround_sketch=QuantileSketch(relative_accuracy),
+        response_sketch=QuantileSketch(relative_accuracy),
+    )
+    if keep_vectors:
+        metrics.wait = array('q', bytes(8 * n))
+        metrics.turnaround = array('q', bytes(8 * n))
+        metrics.response = array('q', bytes(8 * n))
+
+    last_pid: Dict[int, int] = {} # Último pid atendido por núcleo
+    t_min = None
+    t_max = 0
+    max_core = 0
+
+    for pid, start, end, core in iter_slices(timeline):
+        i = index[pid]
+        metrics.busy_time += end - start
+        if t_min is None or start < t_min:
+            t_min = start
+        if end > t_max:
+            t_max = end
+        if core > max_core:
+            max_core = core
+
+        prev = last_pid.get(core)
+        if prev is not None and prev != pid:
+            metrics.context_switches += 1
+        last_pid[core] = pid
+
+        if first_start[i] < 0:
+            first_start[i] = start
+        served[i] += end - start
+
+        proc = processes[i]
+        if served[i] == proc.burst_time:
+            # Evento de finalización
+            turnaround = end - proc.arrival_time
+            wait = turnaround - proc.burst_time
+            response = first_start[i] - proc.arrival_time
+            metrics.completed += 1
+            metrics.wait_sketch.add(wait)
+            metrics.turnaround_sketch.add(turnaround)
+            metrics.response_sketch.add(response)
+            if keep_vectors:
+                metrics.wait[i] = wait
+                metrics.turnaround[i] = turnaround
+                metrics.response[i] = response
+
+    metrics.cores = cores or max_core + 1
+    metrics.makespan = t_max - t_min if t_min is not None else 0
+    return metrics
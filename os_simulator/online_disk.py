@@ -0,0 +1,395 @@
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from models import Process
+from metrics import QuantileSketch
+from structures import FenwickTree
+from timeline import iter_slices
+
+class CylinderQueue:
+    """
+    Peticiones pendientes indexadas por cilindro: un árbol de Fenwick con la
+    cantidad pendiente por cilindro y una FIFO de ids por cilindro. Insertar,
+    retirar y buscar el pendiente más cercano a cada lado del cabezal cuestan
+    O(log cilindros), sin reordenar nada al llegar peticiones nuevas.
+    """
+
+    def __init__(self, cylinders: int):
+        self.cylinders = cylinders
+        self.counts = FenwickTree(cylinders)
+        self.fifo: Dict[int, deque] = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, cylinder: int, rid: int):
+        queue = self.fifo.get(cylinder)
+        if queue is None:
+            queue = self.fifo[cylinder] = deque()
+        queue.append(rid)
+        self.counts.add(cylinder, 1)
+        self.size += 1
+
+    def oldest(self, cylinder: int) -> int:
+        return self.fifo[cylinder][0]
+
+    def pop(self, cylinder: int) -> int:
+        # Retira la petición más antigua del cilindro
+        queue = self.fifo[cylinder]
+        rid = queue.popleft()
+        if not queue:
+            del self.fifo[cylinder]
+        self.counts.add(cylinder, -1)
+        self.size -= 1
+        return rid
+
+    def below(self, position: int) -> int:
+        # Mayor cilindro pendiente < position, o -1
+        k = self.counts.prefix_sum(position)
+        return self.counts.find(k) if k else -1
+
+    def at_or_above(self, position: int) -> int:
+        # Menor cilindro pendiente >= position, o -1
+        k = self.counts.prefix_sum(position)
+        return self.counts.find(k + 1) if k < self.size else -1
+
+class OnlineDiskStrategy(ABC):
+    """
+    Planificador de disco con cola dinámica: las peticiones se agregan a
+    medida que se emiten y, cada vez que el cabezal queda libre, `next`
+    elige la siguiente. Los ids son números de emisión (menor = más antigua);
+    `add` recibe además el instante de emisión y `next` el instante actual,
+    que sólo usan las estrategias con plazos (Deadline).
+    `next` retorna (cilindro, id, desplazamiento recorrido).
+    """
+
+    def reset(self, cylinders: int):
+        self.cylinders = cylinders
+
+    @abstractmethod
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        pass
+
+    @abstractmethod
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        pass
+
+class OnlineFCFSStrategy(OnlineDiskStrategy):
+    def reset(self, cylinders: int):
+        super().reset(cylinders)
+        self.queue = deque()
+
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        self.queue.append((cylinder, rid))
+
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        cylinder, rid = self.queue.popleft()
+        return cylinder, rid, abs(cylinder - head)
+
+    def __len__(self):
+        return len(self.queue)
+
+class OnlineSSTFStrategy(OnlineDiskStrategy):
+    # El pendiente más cercano; en un empate de distancia, el emitido primero
+    def reset(self, cylinders: int):
+        super().reset(cylinders)
+        self.pending = CylinderQueue(cylinders)
+
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        self.pending.add(cylinder, rid)
+
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        pending = self.pending
+        left = pending.below(head)
+        right = pending.at_or_above(head)
+        if right < 0:
+            cylinder = left
+        elif left < 0:
+            cylinder = right
+        else:
+            d_left, d_right = head - left, right - head
+            if d_left < d_right or (d_left == d_right and pending.oldest(left) < pending.oldest(right)):
+                cylinder = left
+            else:
+                cylinder = right
+        return cylinder, pending.pop(cylinder), abs(cylinder - head)
+
+    def __len__(self):
+        return len(self.pending)
+
+class OnlineSCANStrategy(OnlineDiskStrategy):
+    """
+    Elevador sobre la cola dinámica: sigue en la dirección actual mientras
+    haya pendientes por delante (incluidas las que llegan durante el barrido)
+    y, si no, invierte. Con `to_edge` (SCAN) llega antes al extremo; sin él
+    (LOOK) da la vuelta en el último pendiente.
+    """
+
+    def __init__(self, direction: str = "up", to_edge: bool = True):
+        if direction not in ("up", "down"):
+            raise ValueError(f"Dirección inválida: {direction}")
+        self.initial_direction = direction
+        self.to_edge = to_edge
+
+    def reset(self, cylinders: int):
+        super().reset(cylinders)
+        self.pending = CylinderQueue(cylinders)
+        self.up = self.initial_direction == "up"
+
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        self.pending.add(cylinder, rid)
+
+    def _ahead(self, head: int) -> int:
+        return self.pending.at_or_above(head) if self.up else self.pending.below(head + 1)
+
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        cylinder = self._ahead(head)
+        travel = 0
+        if cylinder < 0:
+            # Nada por delante: (ir al extremo y) cambiar de dirección
+            if self.to_edge:
+                edge = self.cylinders - 1 if self.up else 0
+                travel = abs(edge - head)
+                head = edge
+            self.up = not self.up
+            cylinder = self._ahead(head)
+        travel += abs(cylinder - head)
+        return cylinder, self.pending.pop(cylinder), travel
+
+    def __len__(self):
+        return len(self.pending)
+
+class OnlineNStepSCANStrategy(OnlineSCANStrategy):
+    """
+    N-step SCAN: las peticiones que llegan se agrupan en lotes de `batch_size`
+    y el elevador sólo atiende el lote activo, congelado mientras dura; un
+    lote pasa a la CylinderQueue recién cuando el anterior se vacía. Así
+    ninguna petición espera más que los lotes que tiene delante.
+    Con batch_size=None es FSCAN: todo lo que llega durante un barrido
+    espera en una única cola congelada hasta el siguiente.
+    """
+
+    def __init__(self, batch_size: int = 10, direction: str = "up", to_edge: bool = True):
+        super().__init__(direction, to_edge)
+        self.batch_size = batch_size
+
+    def reset(self, cylinders: int):
+        super().reset(cylinders)
+        self.waiting = deque() # Lotes congelados: listas de (cilindro, id)
+        self.waiting_count = 0
+
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        if not self.waiting or (self.batch_size and len(self.waiting[-1]) >= self.batch_size):
+            self.waiting.append([])
+        self.waiting[-1].append((cylinder, rid))
+        self.waiting_count += 1
+
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        if not len(self.pending):
+            batch = self.waiting.popleft()
+            self.waiting_count -= len(batch)
+            for cylinder, rid in batch:
+                self.pending.add(cylinder, rid)
+        return super().next(head, now)
+
+    def __len__(self):
+        return len(self.pending) + self.waiting_count
+
+class OnlineFSCANStrategy(OnlineNStepSCANStrategy):
+    def __init__(self, direction: str = "up", to_edge: bool = True):
+        super().__init__(None, direction, to_edge)
+
+class OnlineDeadlineStrategy(OnlineDiskStrategy):
+    """
+    Planificador por plazos al estilo mq-deadline de Linux. Lecturas y
+    escrituras van a colas separadas, cada una con un índice por cilindro
+    (CylinderQueue) y una FIFO con el vencimiento de cada petición (emisión
+    + read_expire / write_expire). Se atienden lotes de hasta `fifo_batch`
+    peticiones en orden ascendente de cilindro a partir del cabezal; al
+    empezar un lote se prefieren las lecturas, salvo que las escrituras
+    lleven `writes_starved` lotes postergadas, y si la petición más antigua
+    de la cola elegida ya venció (o no hay nada por delante) el lote parte
+    desde ella. Las peticiones no indican si son lectura o escritura: una
+    fracción `write_ratio` se marca como escritura con una semilla fija.
+    """
+
+    def __init__(self, read_expire: float = 500, write_expire: float = 5000, fifo_batch: int = 16,
+                 writes_starved: int = 2, write_ratio: float = 0.3, seed: int = 42):
+        self.read_expire = read_expire
+        self.write_expire = write_expire
+        self.fifo_batch = fifo_batch
+        self.writes_starved = writes_starved
+        self.write_ratio = write_ratio
+        self.seed = seed
+
+    def reset(self, cylinders: int):
+        super().reset(cylinders)
+        self.rng = random.Random(self.seed)
+        self.sorted = [CylinderQueue(cylinders), CylinderQueue(cylinders)] # 0 = lectura, 1 = escritura
+        self.fifo = [deque(), deque()] # (vencimiento, id, cilindro)
+        self.pending_ids = set()
+        self.direction = 0
+        self.batching = 0
+        self.starved = 0
+
+    def add(self, cylinder: int, rid: int, time: float = 0):
+        write = 1 if self.rng.random() < self.write_ratio else 0
+        self.sorted[write].add(cylinder, rid)
+        expire = self.write_expire if write else self.read_expire
+        self.fifo[write].append((time + expire, rid, cylinder))
+        self.pending_ids.add(rid)
+
+    def _fifo_head(self, direction: int):
+        # Descarta las entradas ya atendidas por el recorrido ordenado
+        fifo = self.fifo[direction]
+        while fifo and fifo[0][1] not in self.pending_ids:
+            fifo.popleft()
+        return fifo[0] if fifo else None
+
+    def next(self, head: int, now: float = 0) -> Tuple[int, int, int]:
+        cylinder = -1
+        if self.batching < self.fifo_batch:
+            # Continuar el lote en curso por orden de cilindro
+            cylinder = self.sorted[self.direction].at_or_above(head)
+
+        if cylinder < 0:
+            reads, writes = len(self.sorted[0]), len(self.sorted[1])
+            if reads and not (writes and self.starved >= self.writes_starved):
+                self.direction = 0
+                if writes:
+                    self.starved += 1
+            else:
+                self.direction = 1
+                self.starved = 0
+
+            queue = self.sorted[self.direction]
+            oldest = self._fifo_head(self.direction)
+            cylinder = queue.at_or_above(head)
+            if cylinder < 0 or oldest[0] <= now:
+                cylinder = oldest[2]
+            self.batching = 0
+
+        # La más antigua del cilindro elegido
+        rid = self.sorted[self.direction].pop(cylinder)
+        self.pending_ids.discard(rid)
+        self.batching += 1
+        return cylinder, rid, abs(cylinder - head)
+
+    def __len__(self):
+        return len(self.pending_ids)
+
+@dataclass
+class OnlineDiskResult:
+    seek_time: int = 0
+    served: int = 0
+    makespan: float = 0
+    # Tiempo de respuesta por petición (fin de servicio - emisión), en el orden de entrada
+    response: array = None
+    response_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    # Petición con la peor respuesta (la cola de inanición)
+    worst_request: int = -1
+    # Cilindros en orden de atención (None si no se guarda)
+    sequence: array = None
+
+    @property
+    def throughput(self) -> float:
+        # Peticiones atendidas por unidad de tiempo
+        return self.served / self.makespan if self.makespan else 0.0
+
+def simulate_online_disk(issue_times: List[float], requests: List[int], strategy: OnlineDiskStrategy,
+                         start_pos: int = 0, cylinders: int = 200, time_per_cylinder: float = 1,
+                         transfer_time: float = 1, keep_sequence: bool = True) -> OnlineDiskResult:
+    """
+    Simula el disco con llegadas en el tiempo: la petición i (cilindro
+    requests[i]) entra a la cola en issue_times[i]. Cuando el cabezal queda
+    libre se agregan las ya emitidas y la estrategia elige la siguiente; su
+    servicio dura desplazamiento * time_per_cylinder + transfer_time. Si la
+    cola está vacía el reloj salta a la próxima emisión.
+    """
+    n = len(requests)
+    order = sorted(range(n), key=issue_times.__getitem__)
+    cylinders = max(cylinders, max(requests, default=-1) + 1, start_pos + 1)
+    strategy.reset(cylinders)
+
+    result = OnlineDiskResult(response=array('d', bytes(8 * n)))
+    if keep_sequence:
+        result.sequence = array('i', [start_pos])
+    first_issue = issue_times[order[0]] if n else 0
+    now = first_issue
+    head = start_pos
+    worst = -1.0
+    i = 0
+
+    while i < n or len(strategy):
+        if not len(strategy) and issue_times[order[i]] > now:
+            now = issue_times[order[i]]
+        # Las estrategias identifican cada petición por su número de emisión
+        while i < n and issue_times[order[i]] <= now:
+            strategy.add(requests[order[i]], i, issue_times[order[i]])
+            i += 1
+
+        cylinder, seq, travel = strategy.next(head, now)
+        rid = order[seq]
+        now += travel * time_per_cylinder + transfer_time
+        head = cylinder
+        result.seek_time += travel
+        result.served += 1
+        response = now - issue_times[rid]
+        result.response[rid] = response
+        result.response_sketch.add(response)
+        if response > worst:
+            worst = response
+            result.worst_request = rid
+        if keep_sequence:
+            result.sequence.append(cylinder)
+
+    result.makespan = now - first_issue
+    return result
+
+def issue_times_from_arrivals(processes: List[Process]) -> Tuple[array, array]:
+    # Todas las peticiones de un proceso se emiten a su llegada
+    times, requests = array('q'), array('q')
+    for p in processes:
+        times.extend([p.arrival_time] * len(p.disk_requests))
+        requests.extend(p.disk_requests)
+    return times, requests
+
+def issue_times_from_timeline(processes: List[Process], timeline) -> Tuple[array, array]:
+    """
+    Emisión dirigida por el planificador de CPU: las m peticiones de un
+    proceso se reparten a lo largo de su ejecución; la j-ésima (j = 1..m) se
+    emite cuando el proceso acumula j * ráfaga // (m + 1) unidades de CPU
+    según el timeline. Un proceso que nunca se ejecuta las emite al llegar.
+    """
+    slices: Dict[int, List[Tuple[int, int]]] = {}
+    for pid, start, end, _ in iter_slices(timeline):
+        slices.setdefault(pid, []).append((start, end))
+
+    times, requests = array('q'), array('q')
+    for p in processes:
+        m = len(p.disk_requests)
+        if not m:
+            continue
+        own = sorted(slices.get(p.pid, ()))
+        if not own:
+            times.extend([p.arrival_time] * m)
+            requests.extend(p.disk_requests)
+            continue
+        k = 0
+        served = 0 # CPU acumulada antes del tramo own[k]
+        for j in range(1, m + 1):
+            target = j * p.burst_time // (m + 1)
+            while k < len(own) - 1 and served + own[k][1] - own[k][0] <= target:
+                served += own[k][1] - own[k][0]
+                k += 1
+            times.append(own[k][0] + min(target - served, own[k][1] - own[k][0]))
+        requests.extend(p.disk_requests)
+    return times, requests
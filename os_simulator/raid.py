@@ -0,0 +1,99 @@
+import random
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+class RAIDLayout:
+    """
+    Traduce peticiones lógicas (cilindros de un volumen de `cylinders`) a
+    peticiones físicas por disco. Unidad de striping = 1 cilindro.
+    - RAID-0: el bloque b va al disco b % n, cilindro b // n.
+    - RAID-1: cada disco es un espejo completo; una lectura va al espejo cuyo
+      cabezal (posición de su última petición asignada) está más cerca y una
+      escritura va a todos.
+    - RAID-5: franjas de n-1 bloques de datos más uno de paridad, que rota
+      por disco de franja en franja; una escritura toca el disco de datos y
+      el de paridad (lectura-modificación-escritura en el mismo cilindro).
+    Las peticiones no indican si son lectura o escritura: una fracción
+    `write_ratio` se marca como escritura con una semilla fija.
+    """
+
+    LEVELS = ("RAID-0", "RAID-1", "RAID-5")
+
+    def __init__(self, level: str = "RAID-0", disks: int = 2, cylinders: int = 200,
+                 write_ratio: float = 0.3, seed: int = 42):
+        if level not in self.LEVELS:
+            raise ValueError(f"Nivel RAID desconocido: {level}")
+        if disks < (3 if level == "RAID-5" else 1):
+            raise ValueError(f"{level} requiere al menos {3 if level == 'RAID-5' else 1} discos")
+        self.level = level
+        self.disks = disks
+        self.cylinders = cylinders
+        self.write_ratio = write_ratio
+        self.seed = seed
+
+    def disk_cylinders(self) -> int:
+        # Geometría de cada disco miembro
+        if self.level == "RAID-0":
+            return -(-self.cylinders // self.disks)
+        if self.level == "RAID-5":
+            return -(-self.cylinders // (self.disks - 1))
+        return self.cylinders
+
+    def map(self, requests: List[int], start_pos: int = 0) -> List[array]:
+        n = self.disks
+        per_disk = [array('q') for _ in range(n)]
+        rng = random.Random(self.seed)
+
+        if self.level == "RAID-0":
+            for block in requests:
+                per_disk[block % n].append(block // n)
+        elif self.level == "RAID-1":
+            heads = [start_pos] * n
+            for block in requests:
+                if rng.random() < self.write_ratio:
+                    for d in range(n):
+                        per_disk[d].append(block)
+                        heads[d] = block
+                else:
+                    d = min(range(n), key=lambda k: abs(heads[k] - block))
+                    per_disk[d].append(block)
+                    heads[d] = block
+        else:
+            data_disks = n - 1
+            for block in requests:
+                stripe, j = divmod(block, data_disks)
+                parity = data_disks - stripe % n
+                disk = j if j < parity else j + 1
+                per_disk[disk].append(stripe)
+                if rng.random() < self.write_ratio:
+                    per_disk[parity].append(stripe)
+        return per_disk
+
+@dataclass
+class RAIDResult:
+    level: str = "RAID-0"
+    disks: int = 1
+    logical_requests: int = 0
+    # Por disco: peticiones físicas, desplazamiento y tiempo ocupado
+    requests: List[int] = field(default_factory=list)
+    seek: List[int] = field(default_factory=list)
+    busy_time: List[float] = field(default_factory=list)
+
+    @property
+    def total_seek(self) -> int:
+        return sum(self.seek)
+
+    @property
+    def makespan(self) -> float:
+        # Los discos trabajan en paralelo: termina cuando termina el más ocupado
+        return max(self.busy_time, default=0)
+
+    @property
+    def throughput(self) -> float:
+        # Peticiones lógicas por unidad de tiempo
+        return self.logical_requests / self.makespan if self.makespan else 0.0
+
+    def per_disk(self) -> List[Dict]:
+        return [{'disk': d, 'requests': r, 'seek': s, 'busy_time': b}
+                for d, (r, s, b) in enumerate(zip(self.requests, self.seek, self.busy_time))]
@@ -1,9 +1,87 @@
 import json
-from typing import List, Dict
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable
 from models import Process
-from cpu_scheduler import CPUScheduler, FCFSStrategy, SJFStrategy, RoundRobinStrategy, PriorityStrategy
+from cpu_scheduler import CPUScheduler, FCFSStrategy, SJFStrategy, RoundRobinStrategy, PriorityStrategy, SRTFStrategy, PreemptivePriorityStrategy, MLFQStrategy
 from memory_manager import MemoryManager, FIFOStrategy, LRUStrategy, OptimalStrategy, BestFitStrategy, WorstFitStrategy, FirstFitStrategy, RelocatablePartitionStrategy
-from disk_controller import DiskController, DiskStrategy, FCFSDiskStrategy, SSTFStrategy, SCANStrategy
+from memory_manager import ClockStrategy, EnhancedSecondChanceStrategy, LFUStrategy, AgingStrategy, TLBStrategy
+from memory_manager import lru_fault_curve, fifo_fault_curve, optimal_fault_curve, allocate_frames
+from metrics import CPUMetrics, compute_cpu_metrics
+from working_set import WorkingSetProfile, working_set_profile
+from allocators import FreeListAllocator, BuddyAllocator, DynamicMemoryResult, simulate_dynamic_partitions
+from disk_controller import DiskController, DiskStrategy, FCFSDiskStrategy, request_array, SSTFStrategy, SCANStrategy, LOOKStrategy, CSCANStrategy, CLOOKStrategy
+from online_disk import OnlineDiskResult, OnlineFCFSStrategy, OnlineSSTFStrategy, OnlineSCANStrategy
+from online_disk import OnlineNStepSCANStrategy, OnlineFSCANStrategy, OnlineDeadlineStrategy
+from online_disk import simulate_online_disk, issue_times_from_arrivals, issue_times_from_timeline
+from raid import RAIDLayout, RAIDResult
+from data_generator import DISK_CYLINDERS
+
+# --- Workers del barrido de quantum ---
+# La carga se entrega una sola vez por worker (initializer) como arreglos
+# compactos; con fork ni siquiera se serializa. Cada tarea sólo recibe un int.
+_sweep_processes: List[Process] = []
+
+def _sweep_init(pids: array, arrivals: array, bursts: array, priorities: array):
+    global _sweep_processes
+    _sweep_processes = [Process(pid, a, b, pr, [], []) for pid, a, b, pr in zip(pids, arrivals, bursts, priorities)]
+
+def _sweep_run(quantum: int) -> Dict:
+    strategy = RoundRobinStrategy()
+    strategy.columnar = True
+    timeline, avg_wait, avg_turnaround = strategy.schedule(_sweep_processes, quantum)
+    stats = compute_cpu_metrics(_sweep_processes, timeline, keep_vectors=False)
+    return {
+        'quantum': quantum,
+        'avg_wait': avg_wait,
+        'p99_wait': stats.wait_sketch.quantile(0.99),
+        'avg_turnaround': avg_turnaround,
+        'p99_turnaround': stats.turnaround_sketch.quantile(0.99),
+        'context_switches': stats.context_switches,
+    }
+
+# --- Workers de la paginación por proceso ---
+# Estrategias de paginación disponibles por nombre (las de partición no
+# tienen sentido con reemplazo local)
+PAGING_STRATEGIES = {
+    "FIFO": FIFOStrategy,
+    "LRU": LRUStrategy,
+    "Optimal": OptimalStrategy,
+    "Clock": ClockStrategy,
+    "Second Chance": EnhancedSecondChanceStrategy,
+    "LFU": LFUStrategy,
+    "Aging": AgingStrategy,
+}
+
+def _local_paging_run(algorithm: str, jobs: List) -> List[Dict]:
+    # Cada proceso con su propia instancia (estado de reemplazo local) y sin historial
+    rows = []
+    for pid, frames, refs in jobs:
+        strategy = PAGING_STRATEGIES[algorithm]()
+        strategy.history_mode = "none"
+        faults, hits, _ = strategy.simulate(list(refs), frames, [])
+        rows.append({'pid': pid, 'frames': frames, 'references': len(refs), 'faults': faults, 'hits': hits})
+    return rows
+
+# --- Workers de los arreglos RAID ---
+def _disk_strategy(algorithm: str, cylinders: int, direction: str = "up") -> DiskStrategy:
+    if algorithm == "SSTF":
+        return SSTFStrategy()
+    if algorithm == "SCAN":
+        return SCANStrategy(cylinders, direction)
+    if algorithm == "LOOK":
+        return LOOKStrategy(cylinders, direction)
+    if algorithm == "C-SCAN":
+        return CSCANStrategy(cylinders, direction)
+    if algorithm == "C-LOOK":
+        return CLOOKStrategy(cylinders, direction)
+    return FCFSDiskStrategy()
+
+def _raid_disk_run(algorithm: str, requests: array, start_pos: int, cylinders: int, direction: str):
+    # Cada disco miembro con su propia estrategia; sólo vuelve el desplazamiento
+    seek_time, _ = _disk_strategy(algorithm, cylinders, direction).execute(list(requests), start_pos)
+    return seek_time
 
 class SimulationEngine:
     def __init__(self):
@@ -11,13 +89,22 @@ class SimulationEngine:
         self.cpu_scheduler = CPUScheduler(FCFSStrategy())
         self.memory_manager = MemoryManager(FIFOStrategy())
         self.disk_controller = DiskController(FCFSDiskStrategy())
+        self.disk_cylinders = DISK_CYLINDERS
         
-    def load_data(self, filepath: str):
+    def load_data(self, filepath: str, disk_cylinders: int = None):
         with open(filepath, 'r') as f:
             data = json.load(f)
             self.processes = [Process.from_dict(p) for p in data]
+        # Geometría del disco: la indicada al generar la carga o, si no se
+        # conoce, la mínima que contiene todas las peticiones
+        if disk_cylinders is None:
+            highest = max((max(p.disk_requests) for p in self.processes if p.disk_requests), default=-1)
+            disk_cylinders = max(DISK_CYLINDERS, highest + 1)
+        self.disk_cylinders = disk_cylinders
             
-    def run_cpu_simulation(self, algorithm: str, quantum: int = 2):
+    def run_cpu_simulation(self, algorithm: str, quantum: int = 2, aging_interval: int = None,
+                           mlfq_levels: int = 3, boost_interval: int = None, cores: int = 1,
+                           columnar: bool = False):
         if algorithm == "FCFS":
             self.cpu_scheduler.set_strategy(FCFSStrategy())
         elif algorithm == "SJF":
@@ -26,10 +113,42 @@ class SimulationEngine:
             self.cpu_scheduler.set_strategy(RoundRobinStrategy())
         elif algorithm == "Prioridad":
             self.cpu_scheduler.set_strategy(PriorityStrategy())
+        elif algorithm == "SRTF":
+            self.cpu_scheduler.set_strategy(SRTFStrategy())
+        elif algorithm == "Prioridad Expropiativa":
+            self.cpu_scheduler.set_strategy(PreemptivePriorityStrategy(aging_interval))
+        elif algorithm == "MLFQ":
+            self.cpu_scheduler.set_strategy(MLFQStrategy(mlfq_levels, boost_interval=boost_interval))
+
+        # Con cores > 1 se simula SMP (FCFS, SJF, Prioridad y Round Robin)
+        self.cpu_scheduler.set_cores(cores)
+        # Con columnar=True el timeline es un ColumnarTimeline (ver timeline.py)
+        self.cpu_scheduler.set_columnar(columnar)
             
         return self.cpu_scheduler.run(self.processes, quantum)
 
-    def run_memory_simulation(self, algorithm: str, frames: int = 4):
+    def cpu_metrics(self, timeline, cores: int = None) -> CPUMetrics:
+        # Métricas por proceso, percentiles (p50/p95/p99/max), throughput y
+        # utilización de una corrida de run_cpu_simulation
+        return compute_cpu_metrics(self.processes, timeline, cores)
+
+    def sweep_quantum(self, quanta: Iterable[int], max_workers: int = None) -> List[Dict]:
+        """
+        Ejecuta Round Robin para cada quantum en paralelo (ProcessPoolExecutor,
+        por defecto un worker por núcleo). Retorna una fila por quantum con
+        espera y retorno (promedio y p99) y la cantidad de cambios de contexto.
+        """
+        workload = (
+            array('q', (p.pid for p in self.processes)),
+            array('q', (p.arrival_time for p in self.processes)),
+            array('q', (p.burst_time for p in self.processes)),
+            array('q', (p.priority for p in self.processes)),
+        )
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_sweep_init, initargs=workload) as pool:
+            return list(pool.map(_sweep_run, quanta))
+
+    def run_memory_simulation(self, algorithm: str, frames: int = 4, history_mode: str = "list", history_every: int = None,
+                              tlb_size: int = 0, tlb_associativity: int = None, tlb_policy: str = "LRU"):
         # Para la simulación "All-in-One", concatenamos todas las referencias
         # O podríamos simular por proceso. El prompt dice "Secuencia de referencias... generada por los 1000 procesos"
         # Asumiremos una gran cadena global de referencias para simplificar la visualización del algoritmo
@@ -48,6 +167,14 @@ class SimulationEngine:
             self.memory_manager.set_strategy(LRUStrategy())
         elif algorithm == "Optimal":
             self.memory_manager.set_strategy(OptimalStrategy())
+        elif algorithm == "Clock":
+            self.memory_manager.set_strategy(ClockStrategy())
+        elif algorithm == "Second Chance":
+            self.memory_manager.set_strategy(EnhancedSecondChanceStrategy())
+        elif algorithm == "LFU":
+            self.memory_manager.set_strategy(LFUStrategy())
+        elif algorithm == "Aging":
+            self.memory_manager.set_strategy(AgingStrategy())
         elif algorithm == "Best Fit":
             self.memory_manager.set_strategy(BestFitStrategy())
         elif algorithm == "Worst Fit":
@@ -56,20 +183,241 @@ class SimulationEngine:
             self.memory_manager.set_strategy(FirstFitStrategy())
         elif algorithm == "Relocatable":
             self.memory_manager.set_strategy(RelocatablePartitionStrategy())
+        elif algorithm == "Relocatable Incremental":
+            self.memory_manager.set_strategy(RelocatablePartitionStrategy("incremental"))
+
+        # TLB delante de la estrategia de paginación elegida
+        if tlb_size > 0 and algorithm in ("FIFO", "LRU", "Optimal", "Clock", "Second Chance", "LFU", "Aging"):
+            self.memory_manager.set_strategy(TLBStrategy(self.memory_manager.strategy, tlb_size, tlb_associativity, tlb_policy))
             
+        # history_mode: "list", "array", "checkpoints" o "none" (ver MemoryStrategy)
+        self.memory_manager.set_history(history_mode, history_every)
         return self.memory_manager.run(all_refs, frames, process_sizes)
 
-    def run_disk_simulation(self, algorithm: str, start_pos: int = 50):
+    def memory_fault_curves(self, max_frames: int = None) -> Dict[str, List[int]]:
+        """
+        Fallos de página de LRU, FIFO y Óptimo para cada cantidad de marcos
+        1..max_frames (por defecto, tantos como páginas distintas) sobre la
+        cadena global de referencias.
+        """
+        all_refs = []
+        for p in self.processes:
+            all_refs.extend(p.memory_refs)
+        if max_frames is None:
+            max_frames = len(set(all_refs))
+
+        return {
+            'frames': list(range(1, max_frames + 1)),
+            'total': len(all_refs),
+            'LRU': lru_fault_curve(all_refs, max_frames),
+            'FIFO': fifo_fault_curve(all_refs, max_frames),
+            'Optimal': optimal_fault_curve(all_refs, max_frames),
+        }
+
+    def run_memory_per_process(self, algorithm: str, frames: int = 64, allocation: str = "equal",
+                               window: int = 10, max_workers: int = None) -> Dict:
+        """
+        Paginación con reemplazo local: cada proceso simula sus propias
+        memory_refs con su propia asignación de marcos, repartidos de `frames`:
+        "equal" (partes iguales), "proportional" (según `size`) o
+        "working_set" (según el tamaño medio del working set con ventana
+        `window`). Los procesos son independientes, así que se reparten en
+        lotes entre un ProcessPoolExecutor (max_workers=1 corre en serie).
+        Retorna las filas por proceso y los totales agregados.
+        """
+        procs = [p for p in self.processes if p.memory_refs]
+        if allocation == "proportional":
+            weights = [max(getattr(p, 'size', 0), 1) for p in procs]
+        elif allocation == "working_set":
+            weights = [working_set_profile(p.memory_refs, window, keep_samples=False).mean_size for p in procs]
+        else:
+            weights = [1] * len(procs)
+        allocation_frames = allocate_frames(weights, frames)
+
+        jobs = [(p.pid, f, array('q', p.memory_refs)) for p, f in zip(procs, allocation_frames)]
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) < 2:
+            rows = _local_paging_run(algorithm, jobs)
+        else:
+            # Pocos lotes grandes por worker: cada proceso es una simulación corta
+            size = -(-len(jobs) // (workers * 4))
+            batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rows = [row for batch in pool.map(_local_paging_run, [algorithm] * len(batches), batches) for row in batch]
+
+        faults = sum(r['faults'] for r in rows)
+        hits = sum(r['hits'] for r in rows)
+        references = faults + hits
+        return {
+            'processes': rows,
+            'faults': faults,
+            'hits': hits,
+            'references': references,
+            'fault_rate': faults / references if references else 0.0,
+            'frames_used': sum(allocation_frames),
+        }
+
+    def memory_working_set(self, window: int = 10, quantile: float = 0.95) -> Dict:
+        """
+        Análisis de working set W(t, Δ) y frecuencia de fallos con ventana
+        Δ = `window`. 'series' es la serie de tiempo sobre la cadena global
+        de referencias; 'processes' trae por proceso el working set medio y
+        máximo, los fallos bajo la política de working set y los marcos
+        sugeridos (cuantil `quantile` de W). Dimensiona la memoria sin barrer
+        cantidades de marcos.
+        """
+        all_refs = []
+        rows = []
+        for p in self.processes:
+            all_refs.extend(p.memory_refs)
+            profile = working_set_profile(p.memory_refs, window, keep_samples=False)
+            rows.append({
+                'pid': p.pid,
+                'references': profile.references,
+                'mean_ws': profile.mean_size,
+                'peak_ws': profile.peak_size,
+                'faults': profile.faults,
+                'fault_rate': profile.fault_rate,
+                'suggested_frames': profile.suggested_frames(quantile),
+            })
+
+        overall: WorkingSetProfile = working_set_profile(all_refs, window)
+        return {
+            'series': overall.samples,
+            'global': overall,
+            'processes': rows,
+            'suggested_total': sum(r['suggested_frames'] for r in rows),
+        }
+
+    def run_dynamic_memory_simulation(self, allocator: str = "Free List", total_memory: int = 1024,
+                                      cpu_algorithm: str = "FCFS", quantum: int = 2, cores: int = 1,
+                                      min_block: int = 1) -> DynamicMemoryResult:
+        """
+        Asignación dinámica de particiones: los procesos piden memoria al llegar
+        y la liberan al terminar según el timeline del planificador de CPU.
+        allocator: "Free List" (huecos con coalescencia) o "Buddy".
+        """
+        timeline, _, _ = self.run_cpu_simulation(cpu_algorithm, quantum, cores=cores, columnar=True)
+        if allocator == "Buddy":
+            memory = BuddyAllocator(total_memory, min_block)
+        else:
+            memory = FreeListAllocator(total_memory)
+        return simulate_dynamic_partitions(self.processes, timeline, memory)
+
+    def run_disk_simulation(self, algorithm: str, start_pos: int = 50, direction: str = "up", cylinders: int = None):
         # Concatenar todas las peticiones
         all_requests = []
         for p in self.processes:
             all_requests.extend(p.disk_requests)
-            
+
+        # FCFS recibe un ndarray y usa su camino vectorizado (si hay NumPy)
         if algorithm == "FCFS":
-            self.disk_controller.set_strategy(FCFSDiskStrategy())
-        elif algorithm == "SSTF":
-            self.disk_controller.set_strategy(SSTFStrategy())
-        elif algorithm == "SCAN":
-            self.disk_controller.set_strategy(SCANStrategy())
-            
+            all_requests = request_array(all_requests)
+
+        # Los algoritmos de barrido usan la geometría de la carga y la dirección inicial
+        self.disk_controller.set_strategy(_disk_strategy(algorithm, cylinders or self.disk_cylinders, direction))
         return self.disk_controller.run(all_requests, start_pos)
+
+    def _online_issue_times(self, issue: str, cpu_algorithm: str, quantum: int):
+        # Flujo de peticiones con sus instantes de emisión (ver run_online_disk_simulation)
+        if issue == "cpu":
+            timeline, _, _ = self.run_cpu_simulation(cpu_algorithm, quantum, columnar=True)
+            return issue_times_from_timeline(self.processes, timeline)
+        return issue_times_from_arrivals(self.processes)
+
+    def run_online_disk_simulation(self, algorithm: str = "SSTF", start_pos: int = 50, issue: str = "arrival",
+                                   cpu_algorithm: str = "FCFS", quantum: int = 2, direction: str = "up",
+                                   time_per_cylinder: float = 1, transfer_time: float = 1,
+                                   batch_size: int = 10, workload=None) -> OnlineDiskResult:
+        """
+        Disco con llegadas en el tiempo: cada petición se emite a la llegada
+        de su proceso (issue="arrival") o repartida a lo largo de su ejecución
+        según el timeline del planificador de CPU (issue="cpu"). Reporta el
+        desplazamiento total y la distribución de tiempos de respuesta.
+        algorithm: "FCFS", "SSTF", "SCAN", "LOOK", "N-Step SCAN" (lotes de
+        `batch_size`), "FSCAN" o "Deadline".
+        `workload` = (tiempos, peticiones) ya calculados reemplaza a issue/cpu_algorithm/quantum.
+        """
+        times, requests = workload or self._online_issue_times(issue, cpu_algorithm, quantum)
+
+        if algorithm == "SSTF":
+            strategy = OnlineSSTFStrategy()
+        elif algorithm == "SCAN":
+            strategy = OnlineSCANStrategy(direction, to_edge=True)
+        elif algorithm == "LOOK":
+            strategy = OnlineSCANStrategy(direction, to_edge=False)
+        elif algorithm == "N-Step SCAN":
+            strategy = OnlineNStepSCANStrategy(batch_size, direction)
+        elif algorithm == "FSCAN":
+            strategy = OnlineFSCANStrategy(direction)
+        elif algorithm == "Deadline":
+            strategy = OnlineDeadlineStrategy()
+        else:
+            strategy = OnlineFCFSStrategy()
+
+        return simulate_online_disk(times, requests, strategy, start_pos, self.disk_cylinders,
+                                    time_per_cylinder, transfer_time)
+
+    def compare_online_disk(self, algorithms: Iterable[str], start_pos: int = 50, issue: str = "arrival",
+                            time_per_cylinder: float = 1, transfer_time: float = 1,
+                            batch_size: int = 10, cpu_algorithm: str = "FCFS", quantum: int = 2,
+                            direction: str = "up") -> List[Dict]:
+        """
+        Corre cada algoritmo en línea sobre el mismo flujo de peticiones y
+        retorna una fila por algoritmo: desplazamiento total y throughput
+        frente a la latencia (p50, p99 y peor respuesta). El flujo (y el
+        planificador de CPU, si issue="cpu") se calcula una sola vez.
+        """
+        workload = self._online_issue_times(issue, cpu_algorithm, quantum)
+        rows = []
+        for algorithm in algorithms:
+            result = self.run_online_disk_simulation(algorithm, start_pos, direction=direction,
+                                                     time_per_cylinder=time_per_cylinder, transfer_time=transfer_time,
+                                                     batch_size=batch_size, workload=workload)
+            response = result.response_sketch.summary()
+            rows.append({
+                'algorithm': algorithm,
+                'seek_time': result.seek_time,
+                'throughput': result.throughput,
+                'p50_response': response['p50'],
+                'p99_response': response['p99'],
+                'max_response': response['max'],
+            })
+        return rows
+
+    def run_raid_simulation(self, level: str = "RAID-0", disks: int = 2, algorithm: str = "SSTF",
+                            start_pos: int = 50, direction: str = "up", time_per_cylinder: float = 1,
+                            transfer_time: float = 1, max_workers: int = None) -> RAIDResult:
+        """
+        Arreglo de discos: las peticiones lógicas se reparten entre los discos
+        miembro según el nivel ("RAID-0", "RAID-1" o "RAID-5", ver RAIDLayout)
+        y cada disco se planifica con su propia estrategia `algorithm` en un
+        proceso aparte (ProcessPoolExecutor; max_workers=1 corre en serie).
+        El tiempo ocupado de cada disco es desplazamiento * time_per_cylinder +
+        peticiones * transfer_time, y el makespan el del disco más ocupado.
+        """
+        all_requests = []
+        for p in self.processes:
+            all_requests.extend(p.disk_requests)
+
+        layout = RAIDLayout(level, disks, self.disk_cylinders)
+        cylinders = layout.disk_cylinders()
+        start_pos = min(start_pos, cylinders - 1)
+        per_disk = layout.map(all_requests, start_pos)
+
+        args = ([algorithm] * disks, per_disk, [start_pos] * disks, [cylinders] * disks, [direction] * disks)
+        if max_workers == 1 or disks == 1:
+            seeks = list(map(_raid_disk_run, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers or min(disks, os.cpu_count() or 1)) as pool:
+                seeks = list(pool.map(_raid_disk_run, *args))
+
+        counts = [len(r) for r in per_disk]
+        return RAIDResult(
+            level=level,
+            disks=disks,
+            logical_requests=len(all_requests),
+            requests=counts,
+            seek=seeks,
+            busy_time=[s * time_per_cylinder + c * transfer_time for s, c in zip(seeks, counts)],
+        )
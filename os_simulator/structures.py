@@ -0,0 +1,171 @@
+from typing import List
+
+class IndexedHeap:
+    """
+    Min-heap indexado sobre los ids 0..capacity-1.
+    Guarda la posición de cada id dentro del heap, por lo que además de
+    push/pop permite cambiar la clave (decrease-key / increase-key) o
+    eliminar un id arbitrario en O(log n).
+    """
+
+    def __init__(self, capacity: int):
+        self.heap: List[int] = []
+        self.pos: List[int] = [-1] * capacity
+        self.keys: List = [None] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item: int):
+        return self.pos[item] != -1
+
+    def push(self, item: int, key):
+        self.keys[item] = key
+        self.pos[item] = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def peek(self) -> int:
+        return self.heap[0]
+
+    def pop(self) -> int:
+        item = self.heap[0]
+        self.remove(item)
+        return item
+
+    def remove(self, item: int):
+        i = self.pos[item]
+        last = self.heap.pop()
+        self.pos[item] = -1
+        if i < len(self.heap):
+            self.heap[i] = last
+            self.pos[last] = i
+            self._sift_down(i)
+            self._sift_up(self.pos[last])
+
+    def update(self, item: int, key):
+        old = self.keys[item]
+        self.keys[item] = key
+        if key < old:
+            self._sift_up(self.pos[item])
+        elif old < key:
+            self._sift_down(self.pos[item])
+
+    def _sift_up(self, i: int):
+        heap, pos, keys = self.heap, self.pos, self.keys
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) >> 1
+            other = heap[parent]
+            if not key < keys[other]:
+                break
+            heap[i] = other
+            pos[other] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int):
+        heap, pos, keys = self.heap, self.pos, self.keys
+        n = len(heap)
+        item = heap[i]
+        key = keys[item]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and keys[heap[right]] < keys[heap[child]]:
+                child = right
+            other = heap[child]
+            if not keys[other] < key:
+                break
+            heap[i] = other
+            pos[other] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+class FenwickTree:
+    """
+    Árbol de Fenwick (Binary Indexed Tree) sobre las posiciones 0..size-1:
+    suma de prefijos, actualización puntual y búsqueda de la k-ésima unidad
+    (find) en O(log n).
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, i: int, delta: int):
+        tree = self.tree
+        i += 1
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i: int) -> int:
+        # Suma de las posiciones 0..i-1
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k: int) -> int:
+        # Menor posición i con prefix_sum(i + 1) >= k (k >= 1, valores no negativos);
+        # descenso por potencias de 2 en O(log n). Retorna size si no existe.
+        tree = self.tree
+        i = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = i + step
+            if nxt <= self.size and tree[nxt] < k:
+                i = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return i
+
+class MaxSegmentTree:
+    """
+    Árbol de segmentos de máximos sobre values[0..n-1].
+    Actualización puntual O(log n) y búsqueda del primer índice cuyo valor
+    es >= x (descendiendo por el hijo izquierdo siempre que alcance) en O(log n).
+    """
+
+    def __init__(self, values: List[int]):
+        self.n = len(values)
+        size = 1
+        while size < max(self.n, 1):
+            size *= 2
+        self.size = size
+        self.tree = [0] * (2 * size)
+        self.tree[size:size + self.n] = values
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def __getitem__(self, i: int) -> int:
+        return self.tree[self.size + i]
+
+    def update(self, i: int, value: int):
+        tree = self.tree
+        i += self.size
+        tree[i] = value
+        i >>= 1
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def max(self) -> int:
+        return self.tree[1]
+
+    def first_at_least(self, x: int) -> int:
+        tree = self.tree
+        if self.n == 0 or tree[1] < x:
+            return -1
+        i = 1
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= x else 2 * i + 1
+        return i - self.size
@@ -0,0 +1,83 @@
+from array import array
+from itertools import repeat
+from typing import Dict, Iterator, List, Tuple
+
+class RecordTimeline(list):
+    """
+    Timeline clásico: lista de dicts {'pid', 'start', 'end'} (+ 'core' en SMP).
+    Es una lista normal; `add` sólo unifica la interfaz con ColumnarTimeline.
+    """
+
+    def add(self, pid: int, start: int, end: int, core: int = None):
+        if core is None:
+            self.append({'pid': pid, 'start': start, 'end': end})
+        else:
+            self.append({'pid': pid, 'start': start, 'end': end, 'core': core})
+
+    def slices(self) -> Iterator[Tuple[int, int, int, int]]:
+        return iter_slices(self)
+
+class ColumnarTimeline:
+    """
+    Timeline en columnas: tres arreglos tipados int32 (pid, start, end) y un
+    cuarto opcional (core), ~12 bytes por tramo frente a los cientos de un
+    dict. Los valores deben caber en 32 bits (si no, `array` lanza OverflowError).
+    `to_dataframe` expone las columnas a pandas sin copiarlas; mientras ese
+    DataFrame exista el timeline no puede crecer (BufferError).
+    """
+
+    TYPECODE = 'i'
+
+    def __init__(self, with_core: bool = False):
+        self.pid = array(self.TYPECODE)
+        self.start = array(self.TYPECODE)
+        self.end = array(self.TYPECODE)
+        self.core = array(self.TYPECODE) if with_core else None
+
+    def add(self, pid: int, start: int, end: int, core: int = None):
+        self.pid.append(pid)
+        self.start.append(start)
+        self.end.append(end)
+        if self.core is not None:
+            self.core.append(core)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, i: int) -> Dict:
+        record = {'pid': self.pid[i], 'start': self.start[i], 'end': self.end[i]}
+        if self.core is not None:
+            record['core'] = self.core[i]
+        return record
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self[i] for i in range(len(self)))
+
+    def slices(self) -> Iterator[Tuple[int, int, int, int]]:
+        # Recorrido directo de las columnas, sin construir dicts
+        return zip(self.pid, self.start, self.end, self.core if self.core is not None else repeat(0))
+
+    def nbytes(self) -> int:
+        columns = [self.pid, self.start, self.end] + ([self.core] if self.core is not None else [])
+        return sum(c.itemsize * len(c) for c in columns)
+
+    def to_records(self) -> List[Dict]:
+        return list(self)
+
+    def to_numpy(self) -> Dict:
+        # Vistas sobre los buffers de los arreglos, sin copia
+        import numpy as np
+        columns = {'pid': self.pid, 'start': self.start, 'end': self.end}
+        if self.core is not None:
+            columns['core'] = self.core
+        return {name: np.frombuffer(col, dtype=np.int32) for name, col in columns.items()}
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.to_numpy(), copy=False)
+
+def iter_slices(timeline) -> Iterator[Tuple[int, int, int, int]]:
+    """Tramos (pid, start, end, core) de cualquier timeline; core = 0 si no hay SMP."""
+    if isinstance(timeline, ColumnarTimeline):
+        return timeline.slices()
+    return ((d['pid'], d['start'], d['end'], d.get('core', 0)) for d in timeline)
@@ -0,0 +1,95 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+@dataclass
+class WorkingSetProfile:
+    window: int = 1
+    references: int = 0
+    # Fallos bajo la política de working set: la página no estaba en W(t-1, Δ)
+    faults: int = 0
+    peak_size: int = 0
+    size_total: int = 0
+    # histogram[w] = referencias en las que W(t, Δ) valía w
+    histogram: array = None
+    # Muestras cada `sample_every` referencias: paso, W(t, Δ) y frecuencia
+    # de fallos (fallos entre las últimas Δ referencias / Δ)
+    samples: List[Dict] = field(default_factory=list)
+
+    @property
+    def mean_size(self) -> float:
+        return self.size_total / self.references if self.references else 0.0
+
+    @property
+    def fault_rate(self) -> float:
+        return self.faults / self.references if self.references else 0.0
+
+    def size_quantile(self, q: float) -> int:
+        # Cuantil exacto de W(t, Δ) a partir del histograma (W <= Δ)
+        if not self.references:
+            return 0
+        rank = q * (self.references - 1)
+        seen = 0
+        for size, count in enumerate(self.histogram):
+            seen += count
+            if seen > rank:
+                return size
+        return self.peak_size
+
+    def suggested_frames(self, q: float = 0.95) -> int:
+        # Marcos que cubren el working set en el (q*100)% de las referencias
+        return max(1, self.size_quantile(q)) if self.references else 0
+
+def working_set_profile(pages: List[int], window: int, sample_every: int = None,
+                        keep_samples: bool = True) -> WorkingSetProfile:
+    """
+    Perfil de working set y de frecuencia de fallos (PFF) en una sola pasada.
+    W(t, Δ) = páginas distintas entre las referencias t-Δ+1..t. Con la marca
+    de último uso de cada página se actualiza en O(1) por paso: la referencia
+    que sale (t-Δ) resta una página si no se volvió a usar desde entonces, y
+    la referencia t suma una si no estaba en la ventana. Es fallo si la página
+    no estaba en W(t-1, Δ). Los fallos
+    de la ventana se cuentan con un bytearray circular de largo Δ; nada se
+    recalcula por ventana. Por defecto se toman
+    ~500 muestras de la serie de tiempo.
+    """
+    window = max(1, window)
+    n = len(pages)
+    if sample_every is None:
+        sample_every = max(1, n // 500)
+
+    profile = WorkingSetProfile(window=window, references=n, histogram=array('q', bytes(8 * (window + 1))))
+    histogram = profile.histogram
+    last_use = {}
+    recent = bytearray(window) # ¿Fue fallo la referencia t? (índice t % Δ)
+    size = 0
+    window_faults = 0
+
+    for t, page in enumerate(pages):
+        old = t - window
+        slot = t % window
+        previous = last_use.get(page, old - 1)
+        if old >= 0:
+            if last_use[pages[old]] == old:
+                size -= 1
+            window_faults -= recent[slot]
+        if previous <= old:
+            size += 1
+        fault = previous < old # No estaba en W(t-1, Δ) = t-Δ..t-1
+        profile.faults += fault
+        recent[slot] = fault
+        window_faults += fault
+        last_use[page] = t
+
+        histogram[size] += 1
+        profile.size_total += size
+        if size > profile.peak_size:
+            profile.peak_size = size
+        if keep_samples and t % sample_every == 0:
+            profile.samples.append({
+                'step': t,
+                'working_set': size,
+                'pff': window_faults / min(t + 1, window),
+            })
+
+    return profile
@@ -12,9 +12,13 @@ sys.path.append(os.path.join(current_dir, 'os_simulator'))
 try:
     from os_simulator.simulation_engine import SimulationEngine
     from os_simulator.data_generator import generate_data
+    from os_simulator.memory_manager import history_points
+    from os_simulator.disk_controller import seek_distances
 except ImportError:
     from simulation_engine import SimulationEngine
     from data_generator import generate_data
+    from memory_manager import history_points
+    from disk_controller import seek_distances
 
 # Configuración de la página
 st.set_page_config(page_title="OS Simulator", layout="wide", page_icon="🖥️")
@@ -125,11 +129,12 @@ def main():
             st.markdown("### Configuración")
             num_procs = st.number_input("Cantidad de Procesos", min_value=10, value=1000, step=10)
             seed_val = st.number_input("Semilla (Seed)", value=135)
+            disk_cyl = st.number_input("Cilindros del Disco", min_value=10, value=200, step=10)
             
             st.write("")
             if st.button("GENERAR DATOS NUEVOS", type="primary"):
-                generate_data(num_processes=num_procs, seed=seed_val)
-                st.session_state.engine.load_data("process_data.json")
+                generate_data(num_processes=num_procs, seed=seed_val, disk_cylinders=disk_cyl)
+                st.session_state.engine.load_data("process_data.json", disk_cylinders=disk_cyl)
                 st.session_state.data_loaded = True
                 st.success(f"Datos generados: {num_procs} procesos")
 
@@ -165,25 +170,44 @@ def main():
             st.warning("⚠️ Por favor genere los datos en el Dashboard primero.")
         else:
             # Panel de Control
-            c1, c2, c3 = st.columns([2, 1, 1])
+            c1, c2, c3, c4, c5, c6 = st.columns([2, 1, 1, 1, 1, 1])
             with c1:
-                cpu_algo = st.selectbox("Algoritmo de Planificación", ["FCFS", "Round Robin", "SJF", "Prioridad"])
+                cpu_algo = st.selectbox("Algoritmo de Planificación", ["FCFS", "Round Robin", "SJF", "Prioridad", "SRTF", "Prioridad Expropiativa", "MLFQ"])
             with c2:
                 quantum = st.number_input("Quantum (RR)", value=2, min_value=1)
             with c3:
+                aging = st.number_input("Aging (0 = sin aging)", value=0, min_value=0)
+            with c4:
+                cores = st.number_input("Núcleos (SMP)", value=1, min_value=1, max_value=64)
+            with c5:
+                # Por defecto 10 veces el quantum del nivel inferior (3 niveles: quantum * 4)
+                boost = st.number_input("Boost MLFQ (0 = sin boost)", value=10 * (quantum << 2), min_value=0)
+            with c6:
                 st.write("")
                 st.write("")
                 run_cpu = st.button("EJECUTAR", type="primary")
 
             if run_cpu:
-                timeline, avg_wait, avg_turn = st.session_state.engine.run_cpu_simulation(cpu_algo, quantum)
+                try:
+                    timeline, avg_wait, avg_turn = st.session_state.engine.run_cpu_simulation(cpu_algo, quantum, aging or None, boost_interval=boost or None, cores=cores, columnar=True)
+                except ValueError as e:
+                    st.error(str(e))
+                    st.stop()
+                
+                cpu_stats = st.session_state.engine.cpu_metrics(timeline, cores)
+                wait_stats = cpu_stats.wait_sketch.summary()
                 
                 st.markdown("---")
                 # Métricas
                 kpi1, kpi2, kpi3 = st.columns(3)
                 kpi1.metric("Tiempo Espera Promedio", f"{avg_wait:.2f} ms")
                 kpi2.metric("Tiempo Retorno Promedio", f"{avg_turn:.2f} ms")
-                kpi3.metric("Throughput", f"{len(timeline)/100:.2f} p/s")
+                kpi3.metric("Throughput", f"{cpu_stats.throughput:.4f} p/ms")
+                
+                kpi4, kpi5, kpi6 = st.columns(3)
+                kpi4.metric("Espera p95 / p99", f"{wait_stats['p95']:.0f} / {wait_stats['p99']:.0f} ms")
+                kpi5.metric("Espera Máxima", f"{wait_stats['max']:.0f} ms")
+                kpi6.metric("Utilización CPU", f"{cpu_stats.utilization * 100:.2f}%")
                 
                 st.markdown("---")
                 
@@ -193,7 +217,7 @@ def main():
                 with g_col:
                     st.markdown("#### Diagrama de Gantt")
                     if timeline:
-                        df_timeline = pd.DataFrame(timeline)
+                        df_timeline = timeline.to_dataframe()
                         df_view = df_timeline.head(30)
                         
                         plt.style.use('default') # Fondo blanco solicitado
@@ -212,6 +236,34 @@ def main():
                     if timeline:
                         st.dataframe(df_timeline, height=400, use_container_width=True)
 
+            # Barrido de quantum (Round Robin) en paralelo
+            st.markdown("---")
+            with st.expander("BARRIDO DE QUANTUM (Round Robin)"):
+                s1, s2, s3 = st.columns([1, 1, 1])
+                with s1:
+                    q_min = st.number_input("Quantum mínimo", value=1, min_value=1)
+                with s2:
+                    q_max = st.number_input("Quantum máximo", value=20, min_value=1)
+                with s3:
+                    st.write("")
+                    st.write("")
+                    run_sweep = st.button("BARRER")
+
+                if run_sweep and q_max >= q_min:
+                    rows = st.session_state.engine.sweep_quantum(range(q_min, q_max + 1))
+                    df_sweep = pd.DataFrame(rows)
+
+                    plt.style.use('default')
+                    fig, ax = plt.subplots(figsize=(10, 4))
+                    ax.plot(df_sweep['quantum'], df_sweep['avg_wait'], marker='o', color='#3b82f6', label="Espera promedio")
+                    ax.plot(df_sweep['quantum'], df_sweep['p99_wait'], marker='o', color='#ef4444', label="Espera p99")
+                    ax.set_xlabel("Quantum")
+                    ax.set_ylabel("Tiempo")
+                    ax.grid(True, alpha=0.3)
+                    ax.legend()
+                    st.pyplot(fig)
+                    st.dataframe(df_sweep, use_container_width=True)
+
     # --- PÁGINA 3: MEMORIA ---
     elif selected_page == "MEMORY MANAGER":
         st.markdown("## <i class='fa-solid fa-memory fa-icon-header'></i> GESTIÓN DE MEMORIA", unsafe_allow_html=True)
@@ -219,14 +271,17 @@ def main():
         if not st.session_state.data_loaded:
             st.warning("⚠️ Por favor genere los datos en el Dashboard primero.")
         else:
-            c1, c2, c3 = st.columns([2, 1, 1])
+            c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
             with c1:
                 mem_algo = st.selectbox("Estrategia de Asignación", 
                     ["FIFO (Paginación)", "LRU (Paginación)", "Óptimo (Paginación)", 
-                     "Best Fit (Bloques)", "Worst Fit (Bloques)", "First Fit (Bloques)", "Partición Reubicable"])
+                     "Clock (Paginación)", "Segunda Oportunidad Mejorada (Paginación)", "LFU (Paginación)", "Aging (Paginación)",
+                     "Best Fit (Bloques)", "Worst Fit (Bloques)", "First Fit (Bloques)", "Partición Reubicable", "Partición Reubicable Incremental"])
             with c2:
                 frames = st.number_input("Marcos / Bloques", value=4, min_value=1)
             with c3:
+                tlb_size = st.number_input("Entradas TLB (0 = sin TLB)", value=0, min_value=0)
+            with c4:
                 st.write("")
                 st.write("")
                 run_mem = st.button("SIMULAR", type="primary")
@@ -234,11 +289,14 @@ def main():
             if run_mem:
                 algo_map = {
                     "FIFO (Paginación)": "FIFO", "LRU (Paginación)": "LRU", "Óptimo (Paginación)": "Optimal",
+                    "Clock (Paginación)": "Clock", "Segunda Oportunidad Mejorada (Paginación)": "Second Chance",
+                    "LFU (Paginación)": "LFU", "Aging (Paginación)": "Aging",
                     "Best Fit (Bloques)": "Best Fit", "Worst Fit (Bloques)": "Worst Fit",
-                    "First Fit (Bloques)": "First Fit", "Partición Reubicable": "Relocatable"
+                    "First Fit (Bloques)": "First Fit", "Partición Reubicable": "Relocatable",
+                    "Partición Reubicable Incremental": "Relocatable Incremental"
                 }
                 internal_name = algo_map.get(mem_algo, "FIFO")
-                res_mem = st.session_state.engine.run_memory_simulation(internal_name, frames)
+                res_mem = st.session_state.engine.run_memory_simulation(internal_name, frames, history_mode="checkpoints", tlb_size=tlb_size)
                 
                 if res_mem:
                     faults, hits, history = res_mem
@@ -255,12 +313,11 @@ def main():
                     g_col, t_col = st.columns([1, 1])
                     with g_col:
                         st.markdown("#### Historial de Fallos")
-                        step = max(1, len(history) // 200)
-                        sampled_hist = history[::step]
+                        steps, sampled_hist = history_points(history)
                         
                         plt.style.use('default')
                         fig, ax = plt.subplots(figsize=(10, 5))
-                        ax.plot(range(0, len(history), step), sampled_hist, color='#ef4444', linewidth=2)
+                        ax.plot(steps, sampled_hist, color='#ef4444', linewidth=2)
                         ax.set_xlabel("Tiempo")
                         ax.set_ylabel("Fallos Acumulados")
                         ax.grid(True, alpha=0.3)
@@ -268,12 +325,129 @@ def main():
                         
                     with t_col:
                         st.markdown("#### Estadísticas")
+                        metricas = ["Total Accesos", "Fallos", "Aciertos", "Ratio"]
+                        valores = [total, faults, hits, f"{ratio:.2f}%"]
+                        mem_strategy = st.session_state.engine.memory_manager.strategy
+                        if hasattr(mem_strategy, "bytes_relocated"):
+                            # Costo de la compactación (particiones reubicables)
+                            metricas += ["Compactaciones", "MB Reubicados", "Asignaciones Movidas"]
+                            valores += [mem_strategy.compactions, mem_strategy.bytes_relocated, mem_strategy.allocations_moved]
+                        if hasattr(mem_strategy, "tlb_hit_rate"):
+                            metricas += ["Aciertos TLB", "Tasa Aciertos TLB", "Tiempo Efectivo de Acceso"]
+                            valores += [mem_strategy.tlb_hits, f"{mem_strategy.tlb_hit_rate * 100:.2f}%", f"{mem_strategy.effective_access_time:.1f} ns"]
                         df_mem = pd.DataFrame({
-                            "Métrica": ["Total Accesos", "Fallos", "Aciertos", "Ratio"],
-                            "Valor": [total, faults, hits, f"{ratio:.2f}%"]
+                            "Métrica": metricas,
+                            "Valor": valores
                         })
                         st.dataframe(df_mem, use_container_width=True)
 
+                    # Curva de fallos para todos los tamaños (sólo paginación)
+                    if internal_name in ("FIFO", "LRU", "Optimal", "Clock", "Second Chance", "LFU", "Aging"):
+                        st.markdown("---")
+                        st.markdown("#### Curva de Fallos (todos los marcos)")
+                        curves = st.session_state.engine.memory_fault_curves()
+                        total_refs = max(curves['total'], 1)
+
+                        plt.style.use('default')
+                        fig, ax = plt.subplots(figsize=(10, 4))
+                        for name, color in (("FIFO", '#f59e0b'), ("LRU", '#3b82f6'), ("Optimal", '#10b981')):
+                            ax.plot(curves['frames'], [f / total_refs * 100 for f in curves[name]], marker='.', color=color, label=name)
+                        ax.axvline(frames, color='#ef4444', linestyle='--', alpha=0.6)
+                        ax.set_xlabel("Marcos")
+                        ax.set_ylabel("Tasa de Fallos (%)")
+                        ax.grid(True, alpha=0.3)
+                        ax.legend()
+                        st.pyplot(fig)
+
+            # Asignación dinámica: liberación al terminar según el planificador de CPU
+            st.markdown("---")
+            with st.expander("ASIGNACIÓN DINÁMICA (liberación según CPU)"):
+                d1, d2, d3, d4 = st.columns([1, 1, 1, 1])
+                with d1:
+                    dyn_alloc = st.selectbox("Asignador", ["Free List", "Buddy"])
+                with d2:
+                    dyn_cpu = st.selectbox("Planificador CPU", ["FCFS", "SJF", "Prioridad", "Round Robin", "SRTF"])
+                with d3:
+                    dyn_total = st.number_input("Memoria Total (MB)", value=1024, min_value=64)
+                with d4:
+                    st.write("")
+                    st.write("")
+                    run_dyn = st.button("SIMULAR DINÁMICA")
+
+                if run_dyn:
+                    dyn = st.session_state.engine.run_dynamic_memory_simulation(dyn_alloc, dyn_total, dyn_cpu)
+                    k1, k2, k3 = st.columns(3)
+                    k1.metric("Asignaciones", dyn.allocations)
+                    k2.metric("Fallos de Asignación", dyn.failures)
+                    k3.metric("Pico de Uso", f"{dyn.peak_used} MB", f"de {dyn.total} MB")
+
+                    if dyn.samples:
+                        df_dyn = pd.DataFrame(dyn.samples)
+                        plt.style.use('default')
+                        fig, ax = plt.subplots(figsize=(10, 4))
+                        ax.plot(df_dyn['time'], df_dyn['external_fragmentation'] * 100, color='#ef4444', label="Fragmentación externa (%)")
+                        ax.plot(df_dyn['time'], df_dyn['used'] / dyn.total * 100, color='#3b82f6', label="Uso (%)")
+                        ax.set_xlabel("Tiempo")
+                        ax.set_ylabel("%")
+                        ax.grid(True, alpha=0.3)
+                        ax.legend()
+                        st.pyplot(fig)
+
+            with st.expander("PAGINACIÓN POR PROCESO (reemplazo local)"):
+                l1, l2, l3, l4 = st.columns([1, 1, 1, 1])
+                with l1:
+                    local_algo = st.selectbox("Algoritmo Local", ["FIFO", "LRU", "Optimal", "Clock", "Second Chance", "LFU", "Aging"])
+                with l2:
+                    local_alloc = st.selectbox("Reparto de Marcos", ["Equitativo", "Proporcional", "Working Set"])
+                with l3:
+                    local_frames = st.number_input("Marcos Totales", value=4000, min_value=1)
+                with l4:
+                    st.write("")
+                    st.write("")
+                    run_local = st.button("SIMULAR POR PROCESO")
+
+                if run_local:
+                    alloc_map = {"Equitativo": "equal", "Proporcional": "proportional", "Working Set": "working_set"}
+                    local = st.session_state.engine.run_memory_per_process(local_algo, local_frames, alloc_map[local_alloc])
+                    k1, k2, k3 = st.columns(3)
+                    k1.metric("Fallos Totales", local['faults'])
+                    k2.metric("Tasa de Fallos", f"{local['fault_rate']*100:.2f}%")
+                    k3.metric("Marcos Asignados", local['frames_used'])
+                    st.dataframe(pd.DataFrame(local['processes']), use_container_width=True)
+
+            with st.expander("WORKING SET Y FRECUENCIA DE FALLOS"):
+                w1, w2, w3 = st.columns([1, 1, 1])
+                with w1:
+                    ws_window = st.number_input("Ventana Δ (referencias)", value=10, min_value=1)
+                with w2:
+                    ws_quantile = st.slider("Cobertura del Working Set", 0.50, 1.00, 0.95)
+                with w3:
+                    st.write("")
+                    st.write("")
+                    run_ws = st.button("ANALIZAR WORKING SET")
+
+                if run_ws:
+                    ws = st.session_state.engine.memory_working_set(ws_window, ws_quantile)
+                    k1, k2, k3 = st.columns(3)
+                    k1.metric("W medio (global)", f"{ws['global'].mean_size:.2f}")
+                    k2.metric("W máximo (global)", ws['global'].peak_size)
+                    k3.metric("Marcos Sugeridos", ws['suggested_total'])
+
+                    if ws['series']:
+                        df_ws = pd.DataFrame(ws['series'])
+                        plt.style.use('default')
+                        fig, ax = plt.subplots(figsize=(10, 4))
+                        ax.plot(df_ws['step'], df_ws['working_set'], color='#3b82f6', label="W(t, Δ)")
+                        ax.set_xlabel("Referencia")
+                        ax.set_ylabel("Páginas")
+                        ax2 = ax.twinx()
+                        ax2.plot(df_ws['step'], df_ws['pff'], color='#ef4444', alpha=0.6, label="Frecuencia de fallos")
+                        ax2.set_ylabel("Fallos / referencia")
+                        ax.grid(True, alpha=0.3)
+                        fig.legend(loc="upper right")
+                        st.pyplot(fig)
+                    st.dataframe(pd.DataFrame(ws['processes']), use_container_width=True)
+
     # --- PÁGINA 4: DISCO ---
     elif selected_page == "DISK CONTROLLER":
         st.markdown("## <i class='fa-solid fa-hard-drive fa-icon-header'></i> CONTROLADOR DE DISCO", unsafe_allow_html=True)
@@ -281,20 +455,24 @@ def main():
         if not st.session_state.data_loaded:
             st.warning("⚠️ Por favor genere los datos en el Dashboard primero.")
         else:
-            c1, c2, c3 = st.columns([2, 1, 1])
+            cylinders = st.session_state.engine.disk_cylinders
+            c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
             with c1:
-                disk_algo = st.selectbox("Algoritmo de Disco", ["FCFS / FIFO", "SSTF", "SCAN"])
+                disk_algo = st.selectbox("Algoritmo de Disco", ["FCFS / FIFO", "SSTF", "SCAN", "LOOK", "C-SCAN", "C-LOOK"])
             with c2:
-                start_pos = st.number_input("Posición Inicial Cabezal", value=50, min_value=0, max_value=199)
+                start_pos = st.number_input("Posición Inicial Cabezal", value=min(50, cylinders - 1), min_value=0, max_value=cylinders - 1)
             with c3:
+                disk_dir = st.selectbox("Dirección Inicial", ["Ascendente", "Descendente"])
+            with c4:
                 st.write("")
                 st.write("")
                 run_disk = st.button("EJECUTAR", type="primary")
 
             if run_disk:
-                disk_map = {"FCFS / FIFO": "FCFS", "SSTF": "SSTF", "SCAN": "SCAN"}
+                disk_map = {"FCFS / FIFO": "FCFS", "SSTF": "SSTF", "SCAN": "SCAN", "LOOK": "LOOK", "C-SCAN": "C-SCAN", "C-LOOK": "C-LOOK"}
                 internal_disk_name = disk_map.get(disk_algo, "FCFS")
-                res_disk = st.session_state.engine.run_disk_simulation(internal_disk_name, start_pos)
+                direction = "up" if disk_dir == "Ascendente" else "down"
+                res_disk = st.session_state.engine.run_disk_simulation(internal_disk_name, start_pos, direction)
 
                 if res_disk:
                     seek_time, sequence = res_disk
@@ -309,7 +487,7 @@ def main():
                     g_col, t_col = st.columns([1, 1])
                     with g_col:
                         st.markdown("#### Secuencia de Acceso")
-                        if sequence:
+                        if len(sequence):
                             plt.style.use('default')
                             fig, ax = plt.subplots(figsize=(10, 6))
                             subset = sequence[:50]
@@ -322,11 +500,94 @@ def main():
                             
                     with t_col:
                         st.markdown("#### Tabla de Movimientos")
-                        if sequence:
-                            diffs = [0] + [abs(sequence[i] - sequence[i-1]) for i in range(1, len(sequence))]
+                        if len(sequence):
+                            diffs = seek_distances(sequence)
                             df_disk = pd.DataFrame({"Paso": range(len(sequence)), "Cilindro": sequence, "Distancia": diffs})
                             st.dataframe(df_disk, height=400, use_container_width=True)
 
+            with st.expander("PLANIFICACIÓN EN LÍNEA (llegadas en el tiempo)"):
+                o1, o2, o3, o4, o5 = st.columns([1, 1, 1, 1, 1])
+                with o1:
+                    online_algo = st.selectbox("Algoritmo en Línea", ["FCFS", "SSTF", "SCAN", "LOOK", "N-Step SCAN", "FSCAN", "Deadline"])
+                with o2:
+                    online_issue = st.selectbox("Emisión", ["Llegada del proceso", "Ejecución en CPU"])
+                with o3:
+                    online_cpu = st.selectbox("Planificador CPU ", ["FCFS", "SJF", "Prioridad", "Round Robin", "SRTF"])
+                with o4:
+                    online_tpc = st.number_input("Tiempo por Cilindro (ms)", value=0.1, min_value=0.0, step=0.05)
+                with o5:
+                    st.write("")
+                    st.write("")
+                    run_online = st.button("SIMULAR EN LÍNEA")
+                    run_compare = st.button("COMPARAR TODOS")
+
+                if run_online:
+                    issue = "cpu" if online_issue == "Ejecución en CPU" else "arrival"
+                    direction = "up" if disk_dir == "Ascendente" else "down"
+                    online = st.session_state.engine.run_online_disk_simulation(
+                        online_algo, start_pos, issue, online_cpu, direction=direction, time_per_cylinder=online_tpc)
+                    resp = online.response_sketch.summary()
+                    k1, k2, k3, k4 = st.columns(4)
+                    k1.metric("Desplazamiento Total", f"{online.seek_time}", "cilindros")
+                    k2.metric("Throughput", f"{online.throughput:.3f} pet/ms")
+                    k3.metric("Respuesta p50 / p99", f"{resp['p50']:.1f} / {resp['p99']:.1f} ms")
+                    k4.metric("Peor Respuesta", f"{resp['max']:.1f} ms")
+
+                    if online.served:
+                        plt.style.use('default')
+                        fig, ax = plt.subplots(figsize=(10, 4))
+                        ax.hist(online.response, bins=50, color='#10b981')
+                        ax.axvline(resp['p99'], color='#ef4444', linestyle='--', label="p99")
+                        ax.set_xlabel("Tiempo de respuesta (ms)")
+                        ax.set_ylabel("Peticiones")
+                        ax.set_yscale('log')
+                        ax.grid(True, alpha=0.3)
+                        ax.legend()
+                        st.pyplot(fig)
+
+                if run_compare:
+                    issue = "cpu" if online_issue == "Ejecución en CPU" else "arrival"
+                    direction = "up" if disk_dir == "Ascendente" else "down"
+                    rows = st.session_state.engine.compare_online_disk(
+                        ["FCFS", "SSTF", "SCAN", "LOOK", "N-Step SCAN", "FSCAN", "Deadline"], start_pos, issue, online_tpc,
+                        cpu_algorithm=online_cpu, direction=direction)
+                    st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+            with st.expander("ARREGLO DE DISCOS (RAID)"):
+                r1, r2, r3, r4 = st.columns([1, 1, 1, 1])
+                with r1:
+                    raid_level = st.selectbox("Nivel", ["RAID-0", "RAID-1", "RAID-5"])
+                with r2:
+                    raid_disks = st.number_input("Discos", value=4, min_value=1, max_value=32)
+                with r3:
+                    raid_algo = st.selectbox("Algoritmo por Disco", ["FCFS", "SSTF", "SCAN", "LOOK", "C-SCAN", "C-LOOK"])
+                with r4:
+                    st.write("")
+                    st.write("")
+                    run_raid = st.button("SIMULAR ARREGLO")
+
+                if run_raid:
+                    direction = "up" if disk_dir == "Ascendente" else "down"
+                    try:
+                        raid = st.session_state.engine.run_raid_simulation(raid_level, raid_disks, raid_algo, start_pos, direction)
+                    except ValueError as e:
+                        st.error(str(e))
+                        st.stop()
+                    k1, k2, k3 = st.columns(3)
+                    k1.metric("Makespan", f"{raid.makespan:.0f} ms")
+                    k2.metric("Throughput", f"{raid.throughput:.3f} pet/ms")
+                    k3.metric("Desplazamiento Total", f"{raid.total_seek}", "cilindros")
+
+                    df_raid = pd.DataFrame(raid.per_disk())
+                    plt.style.use('default')
+                    fig, ax = plt.subplots(figsize=(10, 4))
+                    ax.bar(df_raid['disk'], df_raid['busy_time'], color='#3b82f6')
+                    ax.set_xlabel("Disco")
+                    ax.set_ylabel("Tiempo ocupado (ms)")
+                    ax.grid(True, alpha=0.3)
+                    st.pyplot(fig)
+                    st.dataframe(df_raid, use_container_width=True)
+
     # --- PÁGINA 5: AYUDA ---
     elif selected_page == "HELP":
         st.markdown("## <i class='fa-solid fa-circle-question fa-icon-header'></i> AYUDA Y DOCUMENTACIÓN", unsafe_allow_html=True)
@@ -341,15 +602,24 @@ def main():
             
         2.  **CPU Monitor**:
             *   Simula la planificación de procesos.
-            *   Algoritmos: FCFS (First Come First Served), Round Robin, SJF (Shortest Job First).
+            *   Algoritmos: FCFS (First Come First Served), Round Robin, SJF (Shortest Job First), Prioridad.
+            *   Expropiativos: SRTF (Shortest Remaining Time First) y Prioridad Expropiativa con aging configurable.
+            *   MLFQ (Multilevel Feedback Queue): el Quantum indicado es el del nivel superior y se duplica en cada nivel; cada Boost unidades de tiempo todos los procesos vuelven al nivel superior (por defecto 10 veces el quantum del nivel inferior).
+            *   SMP: con más de un núcleo, FCFS, SJF, Prioridad y Round Robin usan colas por núcleo con work stealing.
             
         3.  **Memory Manager**:
             *   Simula la asignación de memoria y paginación.
+            *   Paginación: FIFO, LRU, Óptimo, Clock, Segunda Oportunidad Mejorada, LFU y Aging.
             *   Visualiza fallos de página y eficiencia.
             
         4.  **Disk Controller**:
             *   Simula el movimiento del brazo del disco duro.
             *   Algoritmos: FCFS, SSTF (Shortest Seek Time First), SCAN (Elevator).
+            *   Barrido: LOOK, C-SCAN y C-LOOK, con dirección inicial configurable.
+            *   La cantidad de cilindros se define al generar la carga.
+            *   En línea: las peticiones llegan con el proceso o durante su ejecución en CPU; se reportan los tiempos de respuesta (p50, p99 y el peor caso).
+            *   Anti-inanición: N-Step SCAN, FSCAN y Deadline (plazos de lectura/escritura al estilo mq-deadline).
+            *   RAID: striping (RAID-0), espejo con lectura por cabezal más cercano (RAID-1) y paridad rotativa (RAID-5); cada disco se planifica en paralelo.
         """)
 
 if __name__ == "__main__":